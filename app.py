@@ -4,7 +4,7 @@ from services.azure_openai_service import AzureOpenAIService
 from services.google_places_service import GooglePlacesService
 from services.context_manager import ContextManager
 from ui.components import UIComponents
-from ui.sidebar import SidebarManager
+from ui.sidebar import get_sidebar_manager
 from ui.chat_interface import ChatInterface
 from handlers.search_handler import SearchHandler
 from handlers.chat_handler import ChatHandler
@@ -43,7 +43,7 @@ def main():
     
     # Initialize UI components
     ui_components = UIComponents()
-    sidebar_manager = SidebarManager()
+    sidebar_manager = get_sidebar_manager()
     chat_interface = ChatInterface()
 
     # App header
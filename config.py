@@ -16,11 +16,27 @@ class Config:
 
     GOOGLE_PLACES_MAX_REQUESTS_PER_SECOND = int(os.getenv("GOOGLE_PLACES_MAX_REQUESTS_PER_SECOND", 10))
     GOOGLE_PLACES_MAX_REQUESTS_PER_DAY = int(os.getenv("GOOGLE_PLACES_MAX_REQUESTS_PER_DAY", 100000))
+    PLACES_MAX_CONCURRENCY = int(os.getenv("PLACES_MAX_CONCURRENCY", 8))
+    PLACES_MAX_PAGES = int(os.getenv("PLACES_MAX_PAGES", 1))  # opt in to up to 3 pages of 20; each extra page costs a call and a 2s wait
+    PLACES_GRID_SEARCH = os.getenv("PLACES_GRID_SEARCH", "false").lower() == "true"
+    PLACES_GRID_MIN_RADIUS = 10000  # Only subdivide searches wider than 10km
+    PLACES_RETRY_TIMEOUT = int(os.getenv("PLACES_RETRY_TIMEOUT", 10))  # seconds googlemaps may spend retrying 5xx responses
     
     # Google Places API Configuration
     GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
     
     # App Configuration
     MAX_CONTEXT_MESSAGES = 10
+    MAX_CONVERSATION_HISTORY = 200  # initial search pair + most recent follow-ups kept per session
     DEFAULT_SEARCH_RADIUS = 50000  # 50km in meters
-    MAX_RESULTS = 10
\ No newline at end of file
+    MAX_RESULTS = 10
+    
+    # Cache Configuration
+    PLACE_DETAILS_CACHE_SIZE = 2048
+    PLACE_DETAILS_CACHE_TTL = 24 * 60 * 60  # 24 hours in seconds
+    GEOCODE_CACHE_SIZE = 4096
+    GEOCODE_CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
+    SEARCH_CACHE_SIZE = 1024
+    SEARCH_CACHE_TTL = 60 * 60  # 1 hour in seconds
+    NEARBY_CACHE_SIZE = 4096
+    NEARBY_CACHE_TTL = 60 * 60  # 1 hour in seconds
\ No newline at end of file
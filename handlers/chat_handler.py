@@ -129,5 +129,6 @@ class ChatHandler:
         """Handle clearing chat history"""
         self.session_manager.clear_conversation_history(keep_initial_search=True)
         self.services['context'].clear_history()
-        st.success("Chat history cleared!")
+        # Shown as a toast on the next run; anything rendered before st.rerun is discarded
+        st.session_state['_flash'] = "Chat history cleared!"
         st.rerun()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import streamlit as st
 import logging
+from services.google_places_service import PlacesCircuitOpenError
 from utils.session_manager import SessionManager
 
 class SearchHandler:
@@ -16,6 +17,10 @@ class SearchHandler:
         selected_query_type = search_params['selected_query_type']
         search_radius = search_params['search_radius']
         
+        # Record the attempt up front so a search that finds nothing or fails
+        # is not re-run against the APIs on every widget rerun
+        self.session_manager.record_search(location, query_type, search_radius)
+        
         with st.spinner(f"🔍 Searching for the best {selected_query_type.lower()} in {location}..."):
             try:
                 # Search for places
@@ -38,12 +43,23 @@ class SearchHandler:
                         self._suggest_nearby_places(location)
                         
                 else:
+                    self._clear_stale_results()
                     st.error(f"No {selected_query_type.lower()} found in {location}. Try a different location or search type.")
                     
+            except PlacesCircuitOpenError as e:
+                self._clear_stale_results()
+                logging.warning("Search paused by the Places circuit breaker: %s", e)
+                st.warning("⏳ Google Places quota is temporarily paused. Please try again shortly.")
             except Exception as e:
+                self._clear_stale_results()
                 logging.error(f"Error during search: {str(e)}")
                 st.error(f"An error occurred during search: {str(e)}")
     
+    def _clear_stale_results(self):
+        """Forget the previous search so what is shown matches the recorded search"""
+        self.session_manager.clear_search_results()
+        self.services['context'].clear_history()
+    
     def _generate_ai_recommendations(self, location, query_type, places_data):
         """Generate AI recommendations for the search results"""
         context_history = self.services['context'].get_context_messages()
@@ -62,6 +78,8 @@ class SearchHandler:
     
     def _save_to_context(self, user_query, ai_response, location, query_type, results_count):
         """Save the search results to context manager"""
+        # A new search starts a fresh context window, as it does the visible history
+        self.services['context'].clear_history()
         self.services['context'].add_message("user", user_query, {
             "location": location,
             "query_type": query_type,
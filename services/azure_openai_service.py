@@ -10,6 +10,10 @@ import threading
 # Global token storage
 token_data = {"access_token": None, "expires_at": 0}  # Unix timestamp
 
+# Price level -> dollar signs for the prompt, built once instead of per place;
+# Google reports price_level as 0-4, matching the table in utils.helpers
+_PRICE_LEVELS = {1: "$", 2: "$$", 3: "$$$", 4: "$$$$"}
+
 class AzureOpenAIService:
     def __init__(self):
         self.deployment_name = Config.AZURE_OPENAI_DEPLOYMENT_NAME
@@ -201,8 +205,7 @@ class AzureOpenAIService:
                 prompt += f"   Address: {place.get('vicinity', place.get('formatted_address', 'N/A'))}\n"
                 
                 if 'price_level' in place:
-                    price_levels = {1: "$", 2: "$$", 3: "$$$", 4: "$$$$", 5: "$$$$$"}
-                    prompt += f"   Price Level: {price_levels.get(place['price_level'], 'N/A')}\n"
+                    prompt += f"   Price Level: {_PRICE_LEVELS.get(place['price_level'], 'N/A')}\n"
                 
                 if 'types' in place:
                     prompt += f"   Categories: {', '.join(place['types'][:3])}\n"
@@ -4,30 +4,35 @@ import json
 
 class ContextManager:
     def __init__(self):
-        if 'conversation_history' not in st.session_state:
-            st.session_state.conversation_history = []
+        if 'context_messages' not in st.session_state:
+            st.session_state.context_messages = []
         if 'user_preferences' not in st.session_state:
             st.session_state.user_preferences = {}
     
     def add_message(self, role, content, metadata=None):
-        """Add a message to conversation history"""
+        """Add a message to the AI context window"""
         message = {
             'role': role,
             'content': content,
             'timestamp': datetime.now().isoformat(),
             'metadata': metadata or {}
         }
-        st.session_state.conversation_history.append(message)
+        # Kept apart from conversation_history, which SessionManager owns and
+        # caps; this instance is shared across sessions, so create the list lazily
+        if 'context_messages' not in st.session_state:
+            st.session_state.context_messages = []
+        context_messages = st.session_state.context_messages
+        context_messages.append(message)
         
         # Keep only recent messages to manage memory
-        if len(st.session_state.conversation_history) > 20:
-            st.session_state.conversation_history = st.session_state.conversation_history[-20:]
+        if len(context_messages) > 20:
+            st.session_state.context_messages = context_messages[-20:]
     
     def get_context_messages(self):
         """Get formatted messages for AI context"""
         return [
             {"role": msg['role'], "content": msg['content']} 
-            for msg in st.session_state.conversation_history[-10:]
+            for msg in st.session_state.get('context_messages', [])[-10:]
         ]
     
     def save_user_preference(self, key, value):
@@ -39,9 +44,9 @@ class ContextManager:
         return st.session_state.user_preferences.get(key, default)
     
     def clear_history(self):
-        """Clear conversation history"""
-        st.session_state.conversation_history = []
+        """Clear the AI context window"""
+        st.session_state.context_messages = []
     
     def export_history(self):
-        """Export conversation history as JSON"""
-        return json.dumps(st.session_state.conversation_history, indent=2)
\ No newline at end of file
+        """Export the AI context window as JSON"""
+        return json.dumps(st.session_state.get('context_messages', []), indent=2)
\ No newline at end of file
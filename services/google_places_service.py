@@ -1,32 +1,144 @@
 import googlemaps
+from cachetools import TTLCache
 from config import Config
 import logging
+import math
+import random
+import requests
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from .place_ranker import PlaceRanker
+from .places_client import get_shared_client
 from .place_filter import PlaceFilter
 from .place_search_config import PlaceSearchConfig
 from .rate_limiter import RateLimiter
 
 
+def _is_transient_transport_error(error):
+    """Whether a googlemaps TransportError is worth retrying
+    
+    The client wraps requests' read/connect timeouts as googlemaps Timeout and
+    every other requests failure as TransportError, so only dropped connections
+    and 5xx responses are retried here; 4xx HTTPErrors fail fast.
+    """
+    if isinstance(error, googlemaps.exceptions.HTTPError):
+        return 500 <= error.status_code < 600
+    return isinstance(getattr(error, 'base_exception', None), requests.exceptions.ConnectionError)
+
+
+class PlacesCircuitOpenError(Exception):
+    """Raised while Places calls are paused after a burst of quota errors"""
+
+
 class GooglePlacesService:
-    def __init__(self, requests_per_second=10, requests_per_day=100000):
-        self.gmaps = googlemaps.Client(key=Config.GOOGLE_PLACES_API_KEY)
+    def __init__(self, requests_per_second=10, requests_per_day=100000, rate_limiter=None):
+        self.gmaps = get_shared_client()
         self.ranker = PlaceRanker()
         self.filter = PlaceFilter()
         self.search_config = PlaceSearchConfig()
         
-        # Initialize rate limiter
-        self.rate_limiter = RateLimiter(
-            max_requests_per_second=Config.GOOGLE_PLACES_MAX_REQUESTS_PER_SECOND,
-            max_requests_per_day=Config.GOOGLE_PLACES_MAX_REQUESTS_PER_DAY
-        )
+        # Search config is static, so resolve it once up front
+        self._query_cache = {
+            place_type: self.search_config.get_search_queries(place_type)
+            for place_type in self.search_config.known_place_types()
+        }
+        self._category_filters = self.search_config.get_category_filters()
+        
+        # Initialize rate limiter; pass one in to share a quota across services
+        if rate_limiter is None:
+            rate_limiter = RateLimiter(
+                max_requests_per_second=Config.GOOGLE_PLACES_MAX_REQUESTS_PER_SECOND,
+                max_requests_per_day=Config.GOOGLE_PLACES_MAX_REQUESTS_PER_DAY
+            )
+        self.rate_limiter = rate_limiter
         
-        # Track API usage
+        # Track API usage; pool workers and sessions update these concurrently
+        self._stats_lock = threading.Lock()
         self.api_calls_made = 0
         self.api_errors = 0
+        
+        # Shared pool for fanning out independent, I/O-bound API calls
+        self._executor = ThreadPoolExecutor(
+            max_workers=Config.PLACES_MAX_CONCURRENCY,
+            thread_name_prefix="places"
+        )
+        
+        # Caches are shared across Streamlit sessions and pool workers
+        self._cache_lock = threading.Lock()
+        
+        # Place details rarely change, so keep them around for a day
+        self._details_cache = TTLCache(
+            maxsize=Config.PLACE_DETAILS_CACHE_SIZE,
+            ttl=Config.PLACE_DETAILS_CACHE_TTL
+        )
+        
+        # Geocoding results for a place name are effectively static
+        self._geocode_cache = TTLCache(
+            maxsize=Config.GEOCODE_CACHE_SIZE,
+            ttl=Config.GEOCODE_CACHE_TTL
+        )
+        
+        # Ranked search results keyed by ~100m coordinate bucket
+        self._search_cache = TTLCache(
+            maxsize=Config.SEARCH_CACHE_SIZE,
+            ttl=Config.SEARCH_CACHE_TTL
+        )
+        
+        # Raw places_nearby pages keyed by ~100m coordinate bucket and query
+        self._nearby_cache = TTLCache(
+            maxsize=Config.NEARBY_CACHE_SIZE,
+            ttl=Config.NEARBY_CACHE_TTL
+        )
+        
+        # Circuit breaker state for bursts of quota errors, updated by pool workers
+        self._breaker_lock = threading.Lock()
+        self._consecutive_quota_errors = 0
+        self._quota_errors_since = 0
+        self._circuit_open_until = 0
+    
+    def _backoff_delay(self, base_delay, attempt):
+        """Exponential backoff with jitter so concurrent retries don't align"""
+        return random.uniform(base_delay, base_delay * 3 * (2 ** attempt))
+    
+    def _record_quota_error(self):
+        """Count quota errors and open the circuit breaker when they pile up"""
+        max_quota_errors = 5
+        error_window = 60
+        open_duration = 30
+        
+        now = time.time()
+        with self._breaker_lock:
+            if now - self._quota_errors_since > error_window:
+                self._consecutive_quota_errors = 0
+                self._quota_errors_since = now
+            
+            self._consecutive_quota_errors += 1
+            if self._consecutive_quota_errors <= max_quota_errors:
+                return
+            
+            self._circuit_open_until = now + open_duration
+            self._consecutive_quota_errors = 0
+        logging.error("Too many quota errors. Pausing Google Places calls for %d seconds", open_duration)
+    
+    def _check_circuit(self, cause=None):
+        """Fail fast while the circuit breaker is open"""
+        with self._breaker_lock:
+            circuit_open_until = self._circuit_open_until
+        if time.time() < circuit_open_until:
+            raise PlacesCircuitOpenError(
+                f"Google Places calls paused for {circuit_open_until - time.time():.0f}s after repeated quota errors"
+            ) from cause
+    
+    def _record_api_error(self):
+        """Count a failed API call"""
+        with self._stats_lock:
+            self.api_errors += 1
     
     def _make_api_call(self, api_function, *args, **kwargs):
         """Wrapper for all API calls with rate limiting and error handling"""
+        self._check_circuit()
+        
         self.rate_limiter.wait_if_needed()
         
         max_retries = 3
@@ -34,54 +146,160 @@ class GooglePlacesService:
         
         for attempt in range(max_retries):
             try:
-                self.api_calls_made += 1
+                with self._stats_lock:
+                    self.api_calls_made += 1
+                    call_number = self.api_calls_made
                 result = api_function(*args, **kwargs)
                 
-                # Log successful API call
-                logging.info(f"API call {self.api_calls_made} successful")
-                logging.debug(f"API call {self.api_calls_made} successful")
+                with self._breaker_lock:
+                    self._consecutive_quota_errors = 0
+                logging.debug("API call %d successful", call_number)
                 return result
                 
             except googlemaps.exceptions.ApiError as e:
-                self.api_errors += 1
+                self._record_api_error()
                 error_msg = str(e)
                 
                 if "OVER_QUERY_LIMIT" in error_msg:
+                    self._record_quota_error()
+                    self._check_circuit(cause=e)
+                    
                     # Exponential backoff for quota errors
-                    delay = base_delay * (2 ** attempt)
-                    logging.warning(f"Query limit exceeded. Retrying in {delay} seconds (attempt {attempt + 1}/{max_retries})")
+                    delay = self._backoff_delay(base_delay, attempt)
+                    logging.warning("Query limit exceeded. Retrying in %.2f seconds (attempt %d/%d)", delay, attempt + 1, max_retries)
                     time.sleep(delay)
                     continue
                 elif "REQUEST_DENIED" in error_msg:
-                    logging.error(f"API request denied: {error_msg}")
+                    logging.error("API request denied: %s", error_msg)
                     raise
                 elif "INVALID_REQUEST" in error_msg:
-                    logging.error(f"Invalid API request: {error_msg}")
+                    logging.error("Invalid API request: %s", error_msg)
                     raise
                 else:
                     # Other API errors - retry with backoff
                     if attempt < max_retries - 1:
-                        delay = base_delay * (2 ** attempt)
-                        logging.warning(f"API error: {error_msg}. Retrying in {delay} seconds")
+                        delay = self._backoff_delay(base_delay, attempt)
+                        logging.warning("API error: %s. Retrying in %.2f seconds", error_msg, delay)
                         time.sleep(delay)
                         continue
                     else:
-                        logging.error(f"API error after {max_retries} attempts: {error_msg}")
+                        logging.error("API error after %d attempts: %s", max_retries, error_msg)
                         raise
                         
-            except Exception as e:
-                self.api_errors += 1
+            except googlemaps.exceptions.Timeout:
+                # The client already retried up to Config.PLACES_RETRY_TIMEOUT
+                self._record_api_error()
+                logging.error("Google Places request timed out after the client's own retries")
+                raise
+            
+            except googlemaps.exceptions.TransportError as e:
+                self._record_api_error()
+                if not _is_transient_transport_error(e):
+                    logging.error("Transport error: %s", e)
+                    raise
                 if attempt < max_retries - 1:
-                    delay = base_delay * (2 ** attempt)
-                    logging.warning(f"Unexpected error: {str(e)}. Retrying in {delay} seconds")
+                    delay = self._backoff_delay(base_delay, attempt)
+                    logging.warning("Network error: %s. Retrying in %.2f seconds", e, delay)
                     time.sleep(delay)
                     continue
                 else:
-                    logging.error(f"Unexpected error after {max_retries} attempts: {str(e)}")
+                    logging.error("Network error after %d attempts: %s", max_retries, e)
                     raise
+            
+            except Exception as e:
+                self._record_api_error()
+                logging.error("Unexpected error: %s", e)
+                raise
         
         return None
     
+    def _geocode_cached(self, location):
+        """Geocode a location, reusing earlier results for the same normalized name"""
+        key = location.strip().lower()
+        with self._cache_lock:
+            geocode_result = self._geocode_cache.get(key)
+        if geocode_result is None:
+            geocode_result = self._make_api_call(self.gmaps.geocode, location)
+            if geocode_result:
+                with self._cache_lock:
+                    self._geocode_cache[key] = geocode_result
+        return geocode_result
+    
+    def _get_search_queries(self, place_type):
+        """Get search queries for a place type, memoizing unknown types"""
+        search_queries = self._query_cache.get(place_type)
+        if search_queries is None:
+            search_queries = self.search_config.get_search_queries(place_type)
+            self._query_cache[place_type] = search_queries
+        return search_queries
+    
+    def _search_nearby_query(self, lat_lng, radius, query, max_pages=None):
+        """Run a rate-limited places_nearby query, following next_page_token pages"""
+        if max_pages is None:
+            max_pages = Config.PLACES_MAX_PAGES
+        
+        cache_key = (round(lat_lng['lat'], 3), round(lat_lng['lng'], 3), int(radius), query, max_pages)
+        with self._cache_lock:
+            cached = self._nearby_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
+        results = self._make_api_call(
+            self.gmaps.places_nearby,
+            location=lat_lng,
+            radius=radius,
+            type=query
+        )
+        
+        places = []
+        page = 1
+        while results:
+            places.extend(results.get('results', []))
+            
+            next_page_token = results.get('next_page_token')
+            if not next_page_token or page >= max_pages:
+                break
+            
+            # Google only accepts a page token a couple of seconds after issuing it
+            time.sleep(2)
+            try:
+                results = self._make_api_call(self.gmaps.places_nearby, page_token=next_page_token)
+            except Exception as e:
+                logging.warning("Error fetching page %d for %s: %s", page + 1, query, e)
+                break
+            page += 1
+        
+        if places:
+            with self._cache_lock:
+                self._nearby_cache[cache_key] = places
+        
+        return list(places)
+    
+    def _search_areas(self, lat_lng, radius):
+        """Split wide searches into a 3x3 grid of overlapping circles
+        
+        Each nearby search returns at most 20 places per page, and only
+        Config.PLACES_MAX_PAGES pages (one by default), so covering a large
+        radius with smaller circles surfaces places the single search would miss.
+        """
+        if not Config.PLACES_GRID_SEARCH or radius <= Config.PLACES_GRID_MIN_RADIUS:
+            return [(lat_lng, radius)]
+        
+        # Sub-circles of radius/2 centered radius/sqrt(2) apart cover the
+        # square around the original circle
+        step = radius / math.sqrt(2)
+        sub_radius = radius / 2
+        meters_per_degree = 111320
+        lat, lng = lat_lng['lat'], lat_lng['lng']
+        lat_step = step / meters_per_degree
+        lng_step = step / (meters_per_degree * max(math.cos(math.radians(lat)), 0.01))
+        
+        return [
+            ({'lat': lat + row * lat_step, 'lng': lng + col * lng_step}, sub_radius)
+            for row in (-1, 0, 1)
+            for col in (-1, 0, 1)
+        ]
+    
     def search_places(self, location, place_type, radius=None):
         """Search for places using Google Places API with enhanced sorting and category filtering"""
         if radius is None:
@@ -89,62 +307,89 @@ class GooglePlacesService:
         
         try:
             # Get coordinates for the location with rate limiting
-            geocode_result = self._make_api_call(self.gmaps.geocode, location)
+            geocode_result = self._geocode_cached(location)
             if not geocode_result:
                 return []
             
             lat_lng = geocode_result[0]['geometry']['location']
             
-            # Get search queries for the place type
-            search_queries = self.search_config.get_search_queries(place_type)
+            # Reuse recent results for the same area, category and radius
+            cache_key = self._search_cache_key(lat_lng, place_type, radius)
+            with self._cache_lock:
+                cached_results = self._search_cache.get(cache_key)
+            if cached_results is not None:
+                return list(cached_results)
             
-            all_results = []
+            futures = self._submit_searches(lat_lng, place_type, radius)
+            top_results = self._collect_top_results(futures, place_type)
             
-            for query in search_queries:
-                try:
-                    # Make rate-limited API call
-                    results = self._make_api_call(
-                        self.gmaps.places_nearby,
-                        location=lat_lng,
-                        radius=radius,
-                        type=query
-                    )
-                    if results:
-                        all_results.extend(results.get('results', []))
-                        
-                except Exception as e:
-                    logging.warning(f"Error searching for {query}: {str(e)}")
-                    continue
+            if top_results:
+                with self._cache_lock:
+                    self._search_cache[cache_key] = top_results
             
-            # Remove duplicates based on place_id
-            unique_results = {}
-            for place in all_results:
-                place_id = place.get('place_id')
-                if place_id and place_id not in unique_results:
-                    unique_results[place_id] = place
-            
-            # Filter results based on category
-            category_filters = self.search_config.get_category_filters()
-            filtered_results = self.filter.filter_by_category(
-                list(unique_results.values()), 
-                place_type, 
-                category_filters
-            )
-            
-            # Enhanced sorting by quality score
-            sorted_results = self.ranker.sort_places_by_quality(filtered_results)
-            
-            # Log top results for debugging
-            self._log_top_results(sorted_results, place_type)
-            
-            return sorted_results[:Config.MAX_RESULTS]
+            return list(top_results)
             
+        except PlacesCircuitOpenError:
+            # Let callers tell a quota pause apart from an empty result
+            raise
         except Exception as e:
-            logging.error(f"Google Places API error: {str(e)}")
+            logging.error("Google Places API error: %s", e)
             return []
     
+    def _search_cache_key(self, lat_lng, place_type, radius):
+        """Build the search cache key for an area, category and radius"""
+        return (round(lat_lng['lat'], 3), round(lat_lng['lng'], 3), place_type, radius)
+    
+    def _submit_searches(self, lat_lng, place_type, radius):
+        """Submit the rate-limited queries for a place type to the executor"""
+        search_queries = self._get_search_queries(place_type)
+        search_areas = self._search_areas(lat_lng, radius)
+        
+        # Futures are returned in query order so deduplication stays deterministic
+        return [
+            (query, self._executor.submit(self._search_nearby_query, center, area_radius, query))
+            for query in search_queries
+            for center, area_radius in search_areas
+        ]
+    
+    def _collect_top_results(self, futures, place_type):
+        """Deduplicate, filter and rank the results of submitted queries"""
+        # Remove duplicates based on place_id while fanning in
+        unique_results = {}
+        
+        for query, future in futures:
+            try:
+                for place in future.result():
+                    place_id = place.get('place_id')
+                    if place_id:
+                        unique_results.setdefault(place_id, place)
+            except PlacesCircuitOpenError:
+                raise
+            except Exception as e:
+                logging.warning("Error searching for %s: %s", query, e)
+                continue
+        
+        # Filter by category and select the best places by quality score in
+        # one pass; the filter feeds the ranker lazily
+        filtered_results = self.filter.iter_by_category(
+            unique_results.values(), 
+            place_type, 
+            self._category_filters
+        )
+        top_results = self.ranker.top_k_by_quality(filtered_results, Config.MAX_RESULTS)
+        
+        # Log top results for debugging
+        self._log_top_results(top_results, place_type)
+        
+        return top_results
+    
     def get_place_details(self, place_id):
         """Get detailed information about a specific place"""
+        with self._cache_lock:
+            cached = self._details_cache.get(place_id)
+        if cached is not None:
+            return cached
+        
         try:
             result = self._make_api_call(
                 self.gmaps.place,
@@ -153,60 +398,61 @@ class GooglePlacesService:
                        'website', 'opening_hours', 'price_level', 'reviews', 'user_ratings_total',
                         'photos', 'geometry', 'type', 'vicinity', 'international_phone_number', 'url', 'business_status']
             )
-            return result.get('result', {}) if result else {}
+            details = result.get('result', {}) if result else {}
+            if details:
+                with self._cache_lock:
+                    self._details_cache[place_id] = details
+            return details
+        except PlacesCircuitOpenError:
+            raise
         except Exception as e:
-            logging.error(f"Error getting place details: {str(e)}")
+            logging.error("Error getting place details: %s", e)
             return {}
     
     def search_nearby_places(self, location, radius_km=50):
         """Search for nearby places to visit with enhanced sorting"""
         try:
-            geocode_result = self._make_api_call(self.gmaps.geocode, location)
+            geocode_result = self._geocode_cached(location)
             if not geocode_result:
                 return []
             
             lat_lng = geocode_result[0]['geometry']['location']
             radius_meters = radius_km * 1000
             
-            nearby_results = self._make_api_call(
-                self.gmaps.places_nearby,
-                location=lat_lng,
-                radius=radius_meters,
-                type='locality'
-            )
-            
-            results = nearby_results.get('results', []) if nearby_results else []
-            
-            # Sort nearby places by quality as well
-            sorted_results = self.ranker.sort_places_by_quality(results)
+            results = self._search_nearby_query(lat_lng, radius_meters, 'locality', max_pages=1)
             
-            return sorted_results[:10]
+            # Rank nearby places by quality as well
+            return self.ranker.top_k_by_quality(results, 10)
             
+        except PlacesCircuitOpenError:
+            raise
         except Exception as e:
-            logging.error(f"Error searching nearby places: {str(e)}")
+            logging.error("Error searching nearby places: %s", e)
             return []
     
     def get_top_rated_places(self, location, place_type, min_rating=4.0, min_reviews=10, radius=None):
         """Get only high-quality places with minimum rating and review thresholds"""
         places = self.search_places(location, place_type, radius)
         
-        # Filter by minimum criteria
-        filtered_places = [
+        # Filter by minimum criteria; `or 0` also covers explicit None values
+        return [
             place for place in places
-            if place.get('rating', 0) >= min_rating and 
-               place.get('user_ratings_total', 0) >= min_reviews
+            if (place.get('rating') or 0) >= min_rating and
+               (place.get('user_ratings_total') or 0) >= min_reviews
         ]
-        
-        return filtered_places
     
     def get_api_usage_stats(self):
         """Get API usage statistics"""
+        limiter_stats = self.rate_limiter.get_usage_stats()
+        with self._stats_lock:
+            api_calls_made = self.api_calls_made
+            api_errors = self.api_errors
         return {
-            'total_calls': self.api_calls_made,
-            'total_errors': self.api_errors,
-            'error_rate': (self.api_errors / max(self.api_calls_made, 1)) * 100,
-            'daily_requests_remaining': self.rate_limiter.max_requests_per_day - len(self.rate_limiter.requests_per_day),
-            'current_requests_per_second': len(self.rate_limiter.requests_per_second)
+            'total_calls': api_calls_made,
+            'total_errors': api_errors,
+            'error_rate': (api_errors / max(api_calls_made, 1)) * 100,
+            'daily_requests_remaining': limiter_stats['daily_requests_remaining'],
+            'current_requests_per_second': limiter_stats['current_requests_per_second']
         }
     
     def print_api_usage(self):
@@ -235,28 +481,37 @@ class GooglePlacesService:
     
     def _log_top_results(self, sorted_results, place_type):
         """Log top results for debugging"""
-        logging.info(f"Top 5 results for {place_type}:")
+        if not logging.getLogger().isEnabledFor(logging.INFO):
+            return
+        
+        logging.info("Top 5 results for %s:", place_type)
         for i, place in enumerate(sorted_results[:5]):
             score = self.ranker.calculate_score(place)
-            logging.info(f"{i+1}. {place.get('name')} - Score: {score:.2f}, "
-                       f"Rating: {place.get('rating', 'N/A')}, "
-                       f"Reviews: {place.get('user_ratings_total', 0)}")
+            logging.info("%d. %s - Score: %.2f, Rating: %s, Reviews: %s",
+                         i + 1, place.get('name'), score,
+                         place.get('rating', 'N/A'), place.get('user_ratings_total', 0))
     
     def batch_get_place_details(self, place_ids, batch_delay=0.1):
         """Get details for multiple places with controlled batching"""
+        # Pacing is handled by the shared rate limiter, so batch_delay is kept
+        # only for backwards compatibility
         results = {}
+        futures = {}
+        
+        # Duplicate ids are fetched once; cached places never reach the executor
+        for place_id in dict.fromkeys(place_ids):
+            with self._cache_lock:
+                cached = self._details_cache.get(place_id)
+            if cached is not None:
+                results[place_id] = cached
+            else:
+                futures[place_id] = self._executor.submit(self.get_place_details, place_id)
         
-        for i, place_id in enumerate(place_ids):
+        for place_id, future in futures.items():
             try:
-                details = self.get_place_details(place_id)
-                results[place_id] = details
-                
-                # Add small delay between batch requests to be API-friendly
-                if batch_delay > 0 and i < len(place_ids) - 1:
-                    time.sleep(batch_delay)
-                    
+                results[place_id] = future.result()
             except Exception as e:
-                logging.warning(f"Failed to get details for place {place_id}: {str(e)}")
+                logging.warning("Failed to get details for place %s: %s", place_id, e)
                 results[place_id] = {}
         
         return results
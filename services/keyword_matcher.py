@@ -0,0 +1,56 @@
+import re
+
+try:
+    import ahocorasick
+except ImportError:  # optional accelerator; the regex backend covers the same API
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Matches a set of keywords against text in a single scan"""
+    
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        alternatives = sorted(set(self.keywords), key=len, reverse=True)
+        
+        # An Aho-Corasick automaton finds every keyword occurrence in one pass
+        self._automaton = None
+        if ahocorasick is not None and alternatives:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in alternatives:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+        
+        # One precompiled alternation replaces a separate substring scan per keyword
+        if alternatives:
+            alternation = '|'.join(re.escape(keyword) for keyword in alternatives)
+            self._pattern = re.compile(alternation)
+            # Zero-width lookahead reports the longest keyword at every position
+            self._overlapping_pattern = re.compile(f'(?=({alternation}))')
+        else:
+            self._pattern = None
+            self._overlapping_pattern = None
+        
+        # Shorter keywords hidden behind a longer match starting at the same position
+        self._prefixes = {
+            keyword: tuple(other for other in alternatives if other != keyword and keyword.startswith(other))
+            for keyword in alternatives
+        }
+    
+    def search(self, text):
+        """Check whether any keyword occurs in the text"""
+        if self._automaton is not None:
+            return next(self._automaton.iter(text), None) is not None
+        return self._pattern is not None and self._pattern.search(text) is not None
+    
+    def matches(self, text):
+        """Get the set of distinct keywords occurring anywhere in the text"""
+        if self._automaton is not None:
+            return {keyword for _, keyword in self._automaton.iter(text)}
+        if self._overlapping_pattern is None:
+            return set()
+        
+        found = set(self._overlapping_pattern.findall(text))
+        for keyword in tuple(found):
+            found.update(self._prefixes[keyword])
+        return found
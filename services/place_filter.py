@@ -1,40 +1,96 @@
+from types import MappingProxyType
+from .keyword_matcher import KeywordMatcher
+
+
+# Mapping of categories to Google Places API types, built once at import
+_CATEGORY_TYPES = MappingProxyType({
+    'tourist_places': frozenset([
+        'tourist_attraction', 
+        'museum', 
+        'park', 
+        'zoo', 
+        'amusement_park', 
+        'aquarium',
+        'art_gallery',
+        'hindu_temple',
+        'natural_feature',
+        'campground'
+    ]),
+    'restaurants': frozenset([
+        'restaurant', 
+        'meal_takeaway', 
+        'cafe',
+        'bakery',
+        'bar',
+        'food'
+    ]),
+    'activities': frozenset([
+        'spa',
+        'bowling_alley',
+        'movie_theater',
+        'night_club',
+        'stadium',
+        'tourist_attraction',
+        'amusement_park',
+        'park',
+        'zoo',
+        'aquarium',
+        'casino',
+        'movie_rental'
+    ]),
+    'hotels': frozenset([
+        'lodging',
+        'campground',
+        'rv_park'
+    ])
+})
+
+
 class PlaceFilter:
     """Handles filtering of places based on category-specific criteria"""
     
+    def __init__(self):
+        # Compiled keyword matchers per category, reused across searches
+        self._matchers = {}
+    
     def filter_by_category(self, places, category, category_filters):
         """Filter places based on category-specific criteria"""
         if category not in category_filters:
             return places
         
-        filters = category_filters[category]
-        include_keywords = filters.get('include_keywords', [])
-        exclude_keywords = filters.get('exclude_keywords', [])
+        return list(self.iter_by_category(places, category, category_filters))
+    
+    def iter_by_category(self, places, category, category_filters):
+        """Lazily yield places matching category-specific criteria"""
+        if category not in category_filters:
+            yield from places
+            return
         
-        filtered_places = []
+        include_matcher, exclude_matcher = self._get_keyword_matchers(category, category_filters[category])
+        relevant_types = _CATEGORY_TYPES.get(category, frozenset())
         
         for place in places:
-            name = place.get('name', '').lower()
-            types = [t.lower() for t in place.get('types', [])]
-            vicinity = place.get('vicinity', '').lower()
+            # Google place types are already lowercase snake_case
+            types = place.get('types') or ()
             
-            # Combine all text for keyword matching
-            combined_text = f"{name} {' '.join(types)} {vicinity}"
+            # Combine all text for keyword matching, lowercased in one pass
+            combined_text = (
+                place.get('name', '') + ' ' + ' '.join(types) + ' ' + place.get('vicinity', '')
+            ).lower()
             
             # Check if place should be excluded
-            should_exclude = any(keyword in combined_text for keyword in exclude_keywords)
-            if should_exclude:
+            if exclude_matcher.search(combined_text):
                 continue
             
             # Check if place matches category (for stricter filtering)
             matches_category = False
             
             # Check against include keywords
-            if any(keyword in combined_text for keyword in include_keywords):
+            if include_matcher.search(combined_text):
                 matches_category = True
             
             # Check against place types for category alignment
-            relevant_types = self._get_category_type_mapping().get(category, [])
-            if any(place_type in types for place_type in relevant_types):
+            if not relevant_types.isdisjoint(types):
                 matches_category = True
             
             # For tourist places, be more lenient with highly rated places
@@ -42,50 +98,20 @@ class PlaceFilter:
                 matches_category = True
             
             if matches_category:
-                filtered_places.append(place)
-        
-        return filtered_places
+                yield place
+    
+    def _get_keyword_matchers(self, category, filters):
+        """Get compiled include/exclude matchers for a category's filters"""
+        cached = self._matchers.get(category)
+        if cached is None or cached[0] is not filters:
+            cached = (
+                filters,
+                KeywordMatcher(filters.get('include_keywords', [])),
+                KeywordMatcher(filters.get('exclude_keywords', []))
+            )
+            self._matchers[category] = cached
+        return cached[1], cached[2]
     
     def _get_category_type_mapping(self):
         """Get mapping of categories to Google Places API types"""
-        return {
-            'tourist_places': [
-                'tourist_attraction', 
-                'museum', 
-                'park', 
-                'zoo', 
-                'amusement_park', 
-                'aquarium',
-                'art_gallery',
-                'hindu_temple',
-                'natural_feature',
-                'campground'
-            ],
-            'restaurants': [
-                'restaurant', 
-                'meal_takeaway', 
-                'cafe',
-                'bakery',
-                'bar',
-                'food'
-            ],
-            'activities': [
-                'spa',
-                'bowling_alley',
-                'movie_theater',
-                'night_club',
-                'stadium',
-                'tourist_attraction',
-                'amusement_park',
-                'park',
-                'zoo',
-                'aquarium',
-                'casino',
-                'movie_rental'
-            ],
-            'hotels': [
-                'lodging',
-                'campground',
-                'rv_park'
-            ]
-        }
\ No newline at end of file
+        return _CATEGORY_TYPES
@@ -1,4 +1,42 @@
 import math
+import numpy as np
+from .keyword_matcher import KeywordMatcher
+
+# Place types that count towards each category's relevance score
+_TOURIST_TYPES = frozenset({'tourist_attraction', 'museum', 'park', 'church', 'hindu_temple'})
+_FOOD_TYPES = frozenset({'restaurant', 'cafe', 'meal_takeaway'})
+_ACTIVITY_TYPES = frozenset({'gym', 'spa', 'night_club', 'bowling_alley'})
+_HOTEL_TYPES = frozenset({'lodging'})
+
+# Name keyword matcher and relevant place types per category
+_RELEVANCE_RULES = {
+    'tourist_places': (
+        KeywordMatcher(['temple', 'museum', 'park', 'fort', 'palace', 'monument', 'heritage', 'scenic', 'viewpoint', 'attraction']),
+        _TOURIST_TYPES,
+    ),
+    'restaurants': (
+        KeywordMatcher(['restaurant', 'cafe', 'kitchen', 'dining', 'food', 'cuisine']),
+        _FOOD_TYPES,
+    ),
+    'activities': (
+        KeywordMatcher(['club', 'center', 'studio', 'sports', 'gym', 'adventure']),
+        _ACTIVITY_TYPES,
+    ),
+    'hotels': (
+        KeywordMatcher(['hotel', 'resort', 'lodge', 'inn', 'stay']),
+        _HOTEL_TYPES,
+    ),
+}
+
+# Popularity bonus reaches its 5 point cap at 316 reviews, so integer review
+# counts are served from a precomputed table instead of calling log10
+_POPULARITY_CAP_REVIEWS = 316
+_POPULARITY_BONUS = tuple(
+    min(math.log10(count + 1) * 2, 5) for count in range(_POPULARITY_CAP_REVIEWS + 1)
+)
+
+# Credibility factor indexed by min(review count, 100)
+_CREDIBILITY = (0.5,) * 50 + (0.75,) * 50 + (1.0,)
 
 
 class PlaceRanker:
@@ -12,20 +50,25 @@ class PlaceRanker:
         # Base score from rating (0-5 scale)
         rating_score = rating * 2  # Convert to 0-10 scale
         
-        # Popularity bonus based on number of reviews
-        # Use logarithmic scale to prevent places with thousands of reviews from dominating
-        if user_ratings_total > 0:
-            popularity_bonus = min(math.log10(user_ratings_total + 1) * 2, 5)  # Max 5 points
-        else:
-            popularity_bonus = 0
-        
-        # Credibility factor: places with very few reviews get penalized
-        if user_ratings_total < 50:
-            credibility_factor = 0.5  # Reduce score by 50%
-        elif user_ratings_total < 100:
-            credibility_factor = 0.75  # Reduce score by 25%
+        if isinstance(user_ratings_total, int) and user_ratings_total >= 0:
+            # Table lookups for the common integer case
+            popularity_bonus = _POPULARITY_BONUS[min(user_ratings_total, _POPULARITY_CAP_REVIEWS)]
+            credibility_factor = _CREDIBILITY[min(user_ratings_total, 100)]
         else:
-            credibility_factor = 1.0  # No penalty
+            # Popularity bonus based on number of reviews
+            # Use logarithmic scale to prevent places with thousands of reviews from dominating
+            if user_ratings_total > 0:
+                popularity_bonus = min(math.log10(user_ratings_total + 1) * 2, 5)  # Max 5 points
+            else:
+                popularity_bonus = 0
+            
+            # Credibility factor: places with very few reviews get penalized
+            if user_ratings_total < 50:
+                credibility_factor = 0.5  # Reduce score by 50%
+            elif user_ratings_total < 100:
+                credibility_factor = 0.75  # Reduce score by 25%
+            else:
+                credibility_factor = 1.0  # No penalty
         
         # Final score calculation
         final_score = (rating_score + popularity_bonus) * credibility_factor
@@ -34,47 +77,72 @@ class PlaceRanker:
     
     def sort_places_by_quality(self, places):
         """Sort places by rating, review count, and overall quality"""
-        def sort_key(place):
-            # Primary sort: calculated score (higher is better)
-            score = self.calculate_score(place)
-            
-            # Secondary sort: rating (higher is better)
-            rating = place.get('rating', 0)
-            
-            # Tertiary sort: number of reviews (higher is better)
-            review_count = place.get('user_ratings_total', 0)
-            
-            # Return tuple for sorting (negative values for descending order)
-            return (-score, -rating, -review_count)
+        if not places:
+            return []
+        
+        ratings, review_counts = self._extract_columns(places)
+        scores = self._score_columns(ratings, review_counts)
         
-        return sorted(places, key=sort_key)
+        # lexsort uses the last key as primary: score, then rating, then reviews
+        # (negated for descending order, stable for ties like sorted())
+        order = np.lexsort((-review_counts, -ratings, -scores))
+        return [places[i] for i in order]
+    
+    def top_k_by_quality(self, places, k):
+        """Get the k best places in sort_places_by_quality order without a full sort
+        
+        Accepts any iterable, so a lazy filter can feed it without building an
+        intermediate list first.
+        """
+        if k <= 0:
+            return []
+        if not isinstance(places, list):
+            places = list(places)
+        if k >= len(places):
+            return self.sort_places_by_quality(places)
+        
+        ratings, review_counts = self._extract_columns(places)
+        scores = self._score_columns(ratings, review_counts)
+        
+        # Partial selection finds the k-th best score in O(n); everything tied
+        # with it stays a candidate so tie-breaking matches the full sort
+        kth_score = -np.partition(-scores, k - 1)[k - 1]
+        candidates = np.flatnonzero(scores >= kth_score)
+        order = np.lexsort((-review_counts[candidates], -ratings[candidates], -scores[candidates]))
+        return [places[i] for i in candidates[order][:k]]
+    
+    def _extract_columns(self, places):
+        """Pull rating and review count columns out of the place dicts"""
+        count = len(places)
+        ratings = np.fromiter(
+            (place.get('rating') or 0 for place in places), dtype=np.float64, count=count
+        )
+        review_counts = np.fromiter(
+            (place.get('user_ratings_total') or 0 for place in places), dtype=np.float64, count=count
+        )
+        return ratings, review_counts
+    
+    def _score_columns(self, ratings, review_counts):
+        """Vectorized equivalent of calculate_score over column arrays"""
+        rating_score = ratings * 2
+        popularity_bonus = np.minimum(np.log10(review_counts + 1) * 2, 5)
+        credibility_factor = np.where(
+            review_counts < 50, 0.5, np.where(review_counts < 100, 0.75, 1.0)
+        )
+        return (rating_score + popularity_bonus) * credibility_factor
     
     def calculate_relevance_score(self, place, category):
         """Calculate how relevant a place is to the requested category"""
-        name = place.get('name', '').lower()
-        types = [t.lower() for t in place.get('types', [])]
+        rules = _RELEVANCE_RULES.get(category)
+        if rules is None:
+            return 0
         
-        relevance_score = 0
+        keyword_matcher, relevant_types = rules
+        name = place.get('name', '').lower()
         
-        # Category-specific scoring
-        if category == 'tourist_places':
-            tourist_keywords = ['temple', 'museum', 'park', 'fort', 'palace', 'monument', 'heritage', 'scenic', 'viewpoint', 'attraction']
-            relevance_score += sum(2 for keyword in tourist_keywords if keyword in name)
-            relevance_score += sum(1 for place_type in types if place_type in ['tourist_attraction', 'museum', 'park', 'church', 'hindu_temple'])
-            
-        elif category == 'restaurants':
-            food_keywords = ['restaurant', 'cafe', 'kitchen', 'dining', 'food', 'cuisine']
-            relevance_score += sum(2 for keyword in food_keywords if keyword in name)
-            relevance_score += sum(1 for place_type in types if place_type in ['restaurant', 'cafe', 'meal_takeaway'])
-            
-        elif category == 'activities':
-            activity_keywords = ['club', 'center', 'studio', 'sports', 'gym', 'adventure']
-            relevance_score += sum(2 for keyword in activity_keywords if keyword in name)
-            relevance_score += sum(1 for place_type in types if place_type in ['gym', 'spa', 'night_club', 'bowling_alley'])
-            
-        elif category == 'hotels':
-            hotel_keywords = ['hotel', 'resort', 'lodge', 'inn', 'stay']
-            relevance_score += sum(2 for keyword in hotel_keywords if keyword in name)
-            relevance_score += sum(1 for place_type in types if place_type == 'lodging')
+        # Two points per distinct name keyword, one per relevant place type
+        # (Google place types are already lowercase snake_case)
+        relevance_score = 2 * len(keyword_matcher.matches(name))
+        relevance_score += sum(1 for place_type in place.get('types', []) if place_type in relevant_types)
         
-        return relevance_score
\ No newline at end of file
+        return relevance_score
@@ -0,0 +1,50 @@
+import googlemaps
+import orjson
+import threading
+from requests.adapters import HTTPAdapter
+from config import Config
+
+_client = None
+_client_lock = threading.Lock()
+
+
+class PlacesClient(googlemaps.Client):
+    """googlemaps client that decodes response bodies with orjson"""
+    
+    def _get_body(self, response):
+        """Decode the raw response bytes with orjson and apply the stock status checks"""
+        if response.status_code != 200:
+            raise googlemaps.exceptions.HTTPError(response.status_code)
+        
+        body = orjson.loads(response.content)
+        
+        api_status = body["status"]
+        if api_status == "OK" or api_status == "ZERO_RESULTS":
+            return body
+        
+        if api_status == "OVER_QUERY_LIMIT":
+            raise googlemaps.exceptions._OverQueryLimit(api_status, body.get("error_message"))
+        
+        raise googlemaps.exceptions.ApiError(api_status, body.get("error_message"))
+
+
+def get_shared_client():
+    """Get the process-wide Places client, keeping its pooled connections alive across services"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            # Quota errors are surfaced instead of being retried inside the
+            # client, so the service's backoff and circuit breaker see them;
+            # the client's own 5xx retries are bounded by a short timeout
+            client = PlacesClient(
+                key=Config.GOOGLE_PLACES_API_KEY,
+                retry_timeout=Config.PLACES_RETRY_TIMEOUT,
+                retry_over_query_limit=False
+            )
+            
+            # Size the pool for the concurrent fan-out so workers reuse
+            # keep-alive TLS connections instead of opening new ones
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32)
+            client.session.mount('https://', adapter)
+            _client = client
+        return _client
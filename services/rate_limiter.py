@@ -1,54 +1,74 @@
 import logging
 import time
-from collections import deque
 from threading import Lock
 
 
 class RateLimiter:
-    """Thread-safe rate limiter for Google Places API"""
+    """Thread-safe token-bucket rate limiter for Google Places API"""
     
     def __init__(self, max_requests_per_second=10, max_requests_per_day=100000):
         self.max_requests_per_second = max_requests_per_second
         self.max_requests_per_day = max_requests_per_day
-        self.requests_per_second = deque()
-        self.requests_per_day = deque()
         self.lock = Lock()
-        self.daily_reset_time = time.time() + 86400  # 24 hours from now
+        
+        # Token bucket for the per-second limit, refilled from elapsed time
+        self.tokens = float(max_requests_per_second)
+        self.last_refill = time.monotonic()
+        
+        # Daily counter, reset every 24 hours
+        self.daily_count = 0
+        self.daily_reset_time = self.last_refill + 86400  # 24 hours from now
+    
+    def _refill(self, current_time):
+        """Top up the bucket for the time elapsed since the last refill"""
+        elapsed = current_time - self.last_refill
+        if elapsed > 0:
+            self.tokens = min(
+                self.max_requests_per_second,
+                self.tokens + elapsed * self.max_requests_per_second
+            )
+            self.last_refill = current_time
+    
+    def _reset_daily_if_needed(self, current_time):
+        """Reset the daily counter once the 24 hour window has passed"""
+        if current_time >= self.daily_reset_time:
+            self.daily_count = 0
+            self.daily_reset_time = current_time + 86400
     
     def wait_if_needed(self):
         """Wait if necessary to respect rate limits"""
-        with self.lock:
-            current_time = time.time()
-            
-            # Reset daily counter if needed
-            if current_time >= self.daily_reset_time:
-                self.requests_per_day.clear()
-                self.daily_reset_time = current_time + 86400
-            
-            # Clean old requests (older than 1 second)
-            while self.requests_per_second and current_time - self.requests_per_second[0] >= 1.0:
-                self.requests_per_second.popleft()
+        while True:
+            with self.lock:
+                current_time = time.monotonic()
+                self._reset_daily_if_needed(current_time)
+                
+                # Check daily limit
+                if self.daily_count >= self.max_requests_per_day:
+                    wait_time = self.daily_reset_time - current_time
+                    message = "Daily rate limit reached"
+                else:
+                    # Check per-second limit
+                    self._refill(current_time)
+                    if self.tokens >= 1:
+                        # Record this request
+                        self.tokens -= 1
+                        self.daily_count += 1
+                        return
+                    
+                    wait_time = (1 - self.tokens) / self.max_requests_per_second
+                    message = "Rate limit reached"
             
-            # Clean old daily requests (older than 24 hours)
-            while self.requests_per_day and current_time - self.requests_per_day[0] >= 86400:
-                self.requests_per_day.popleft()
-            
-            # Check daily limit
-            if len(self.requests_per_day) >= self.max_requests_per_day:
-                wait_time = 86400 - (current_time - self.requests_per_day[0])
-                logging.info(f"Daily rate limit reached. Waiting {wait_time:.2f} seconds")
-                time.sleep(wait_time)
-                self.requests_per_day.clear()
-                self.daily_reset_time = time.time() + 86400
-            
-            # Check per-second limit
-            if len(self.requests_per_second) >= self.max_requests_per_second:
-                wait_time = 1.0 - (current_time - self.requests_per_second[0])
-                if wait_time > 0:
-                    logging.info(f"Rate limit reached. Waiting {wait_time:.2f} seconds")
-                    time.sleep(wait_time)
-                    current_time = time.time()
-            
-            # Record this request
-            self.requests_per_second.append(current_time)
-            self.requests_per_day.append(current_time)
\ No newline at end of file
+            # Sleep outside the lock so other threads can keep checking the bucket
+            logging.info("%s. Waiting %.2f seconds", message, wait_time)
+            time.sleep(wait_time)
+    
+    def get_usage_stats(self):
+        """Get the remaining daily quota and the current per-second usage"""
+        with self.lock:
+            current_time = time.monotonic()
+            self._reset_daily_if_needed(current_time)
+            self._refill(current_time)
+            return {
+                'daily_requests_remaining': self.max_requests_per_day - self.daily_count,
+                'current_requests_per_second': int(self.max_requests_per_second - self.tokens)
+            }
@@ -27,23 +27,33 @@ class ChatInterface:
         follow_up_messages = self._get_follow_up_messages()
         
         if follow_up_messages:
-            # Display messages in a clean chat format
-            for msg in follow_up_messages[-10:]:  # Show last 10 follow-up messages
-                if msg['role'] == 'user':
-                    html_content = self.ui_components.create_chat_message_html(msg['content'], is_user=True)
-                else:
-                    html_content = self.ui_components.create_chat_message_html(msg['content'], is_user=False)
-                
-                st.markdown(html_content, unsafe_allow_html=True)
+            # Display messages in a clean chat format; bubble HTML is memoized
+            # per message, and each one is stripped like st.markdown does so it
+            # starts its own HTML block
+            html_parts = [
+                self.ui_components.create_chat_message_html(msg['content'], is_user=(msg['role'] == 'user')).strip()
+                for msg in follow_up_messages[-10:]  # Show last 10 follow-up messages
+            ]
+            
+            # Emit the whole conversation as one element instead of one per message
+            st.markdown('\n\n'.join(html_parts), unsafe_allow_html=True)
         else:
             st.info("💡 Start a conversation! Ask any follow-up questions about your travel plans.")
     
     def _get_follow_up_messages(self):
         """Get unique follow-up messages from conversation history"""
+        history = st.session_state.conversation_history
+        
+        # History is only ever appended to or replaced, so the same list at the
+        # same length means the dedup from the previous rerun still holds
+        cached = st.session_state.get('_follow_up_cache')
+        if cached is not None and cached[0] is history and cached[1] == len(history):
+            return cached[2]
+        
         # Only show follow-up conversations (skip first 2 messages which are initial search)
         follow_up_messages = []
-        if len(st.session_state.conversation_history) > 2:
-            follow_up_messages = st.session_state.conversation_history[2:]
+        if len(history) > 2:
+            follow_up_messages = history[2:]
 
         # Remove duplicate messages from the follow_up_messages
         seen_messages = set()
@@ -54,6 +64,7 @@ class ChatInterface:
                 seen_messages.add(msg_content)
                 unique_follow_up_messages.append(msg)
         
+        st.session_state['_follow_up_cache'] = (history, len(history), unique_follow_up_messages)
         return unique_follow_up_messages
     
     def render_chat_input_form(self):
@@ -1,102 +1,155 @@
+import functools
 import streamlit as st
 from utils.helpers import display_places_data, format_ai_response
 
-class UIComponents:
-    """Reusable UI components for the Travel Buddy app"""
-    
-    def display_app_header(self):
-        """Display the app header"""
-        st.title("🧳 Travel Buddy 🏍️")
-        st.markdown("*Your AI-powered travel companion for discovering amazing places, restaurants, activities, and accommodations worldwide.*")
+# Welcome screen markup is static, so it is assembled once at import and sent
+# as a single element; a CSS grid replaces the two st.columns containers
+_WELCOME_CSS = """
+<style>
+    .card {
+        background-color: #f9f9f9;
+        border-radius: 16px;
+        padding: 20px;
+        margin-bottom: 20px;
+        box-shadow: 0 4px 10px rgba(0,0,0,0.05);
+        transition: transform 0.2s ease;
+        border-left: 2px solid #ccc;
+    }
+    .card h4 {
+        margin-top: 0;
+        color: #2c3e50;
+    }
+    .card ul {
+        padding-left: 20px;
+    }
+    .info-box {
+        background-color: #eaf4ff;
+        padding: 15px 20px;
+        border-left: 5px solid #3399ff;
+        border-radius: 8px;
+        margin-bottom: 30px;
+        color: #2c3e50;
+    }
+    .card-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr;
+        column-gap: 16px;
+    }
+    @media (max-width: 640px) {
+        .card-grid {
+            grid-template-columns: 1fr;
+        }
+    }
+</style>
+"""
 
-    def display_welcome_screen(self):
-        """Display a modern welcome screen using cards with a clean, elegant UI"""
+_WELCOME_INFO_BOX = '<div class="info-box">👈 <strong>Please enter a location in the sidebar to get started!</strong></div>'
+
+_WELCOME_CARDS = (
+    ("🏛️ Tourist Places", (
+        "Top attractions and landmarks",
+        "Hidden gems and local favorites",
+        "Cultural and historical sites",
+        "Best visiting times",
+    )),
+    ("🎯 Activities", (
+        "Adventure and outdoor activities",
+        "Cultural experiences",
+        "Entertainment options",
+        "Seasonal recommendations",
+    )),
+    ("🍽️ Restaurants", (
+        "Local cuisine recommendations",
+        "Price ranges and cost estimates",
+        "Popular dishes to try",
+        "Restaurant ratings and reviews",
+    )),
+    ("🏨 Hotels & Resorts", (
+        "Accommodation options",
+        "Price ranges per night",
+        "Amenities and features",
+        "Location advantages",
+    )),
+)
+
+_WELCOME_HTML = (
+    _WELCOME_CSS.strip()
+    + "\n"
+    + _WELCOME_INFO_BOX
+    + "\n\n### 🌟 What Travel Buddy can help you with:\n\n"
+    + '<div class="card-grid">'
+    + "".join(
+        f'<div class="card"><h4>{title}</h4><ul>'
+        + "".join(f"<li>{item}</li>" for item in items)
+        + "</ul></div>"
+        for title, items in _WELCOME_CARDS
+    )
+    + "</div>"
+)
 
-        st.markdown("""
-            <style>
-                .card {
-                    background-color: #f9f9f9;
-                    border-radius: 16px;
-                    padding: 20px;
-                    margin-bottom: 20px;
-                    box-shadow: 0 4px 10px rgba(0,0,0,0.05);
-                    transition: transform 0.2s ease;
-                    border-left: 2px solid #ccc;
-                }
-                .card h4 {
-                    margin-top: 0;
-                    color: #2c3e50;
-                }
-                .card ul {
-                    padding-left: 20px;
-                }
-                .info-box {
-                    background-color: #eaf4ff;
-                    padding: 15px 20px;
-                    border-left: 5px solid #3399ff;
-                    border-radius: 8px;
-                    margin-bottom: 30px;
-                    color: #2c3e50;
-                }
-            </style>
-        """, unsafe_allow_html=True)
 
-        st.markdown('<div class="info-box">👈 <strong>Please enter a location in the sidebar to get started!</strong></div>', unsafe_allow_html=True)
+def _split_markdown_blocks(markdown_text):
+    """Split markdown at top-level blank lines, keeping fenced code and indented continuations whole"""
+    blocks = []
+    in_fence = False
+    for chunk in markdown_text.split('\n\n'):
+        if not in_fence and not chunk.strip():
+            continue
+        
+        # Indented chunks continue the previous list item or code block
+        if blocks and (in_fence or chunk[:1] in (' ', '\t')):
+            blocks[-1] += '\n\n' + chunk
+        else:
+            blocks.append(chunk)
+        
+        fence_markers = sum(1 for line in chunk.split('\n') if line.lstrip().startswith('```'))
+        if fence_markers % 2:
+            in_fence = not in_fence
+    return blocks
 
-        st.subheader("🌟 What Travel Buddy can help you with:")
 
-        col1, col2 = st.columns(2)
+# Chat bubble templates, formatted with str.format instead of rebuilding an
+# f-string on every call
+_USER_MESSAGE_TEMPLATE = """
+<div style="display: flex; justify-content: flex-end; margin: 10px 0;">
+    <div style="background: aliceblue;
+    color: #000; padding: 12px 16px; border-radius: 18px 18px 5px 18px; 
+                max-width: 70%; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
+        <strong>You:</strong><br>{message}
+    </div>
+</div>
+""".strip()
 
-        with col1:
-            st.markdown("""
-                <div class="card">
-                    <h4>🏛️ Tourist Places</h4>
-                    <ul>
-                        <li>Top attractions and landmarks</li>
-                        <li>Hidden gems and local favorites</li>
-                        <li>Cultural and historical sites</li>
-                        <li>Best visiting times</li>
-                    </ul>
-                </div>
-            """, unsafe_allow_html=True)
+_ASSISTANT_MESSAGE_TEMPLATE = """
+<div style="display: flex; justify-content: flex-start; margin: 10px 0;">
+    <div style="background: darkturquoise;
+                color: #000; padding: 12px 16px; border-radius: 18px 18px 18px 5px; 
+                max-width: 70%; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
+        <strong>🤖 Travel Buddy:</strong><br>{message}
+    </div>
+</div>
+""".strip()
 
-            st.markdown("""
-                <div class="card">
-                    <h4>🍽️ Restaurants</h4>
-                    <ul>
-                        <li>Local cuisine recommendations</li>
-                        <li>Price ranges and cost estimates</li>
-                        <li>Popular dishes to try</li>
-                        <li>Restaurant ratings and reviews</li>
-                    </ul>
-                </div>
-            """, unsafe_allow_html=True)
 
-        with col2:
-            st.markdown("""
-                <div class="card">
-                    <h4>🎯 Activities</h4>
-                    <ul>
-                        <li>Adventure and outdoor activities</li>
-                        <li>Cultural experiences</li>
-                        <li>Entertainment options</li>
-                        <li>Seasonal recommendations</li>
-                    </ul>
-                </div>
-            """, unsafe_allow_html=True)
+@functools.lru_cache(maxsize=512)
+def _chat_html(message, is_user):
+    """Build chat bubble HTML once per distinct message; reruns hit the cache"""
+    if is_user:
+        return _USER_MESSAGE_TEMPLATE.format(message=message)
+    return _ASSISTANT_MESSAGE_TEMPLATE.format(message=format_ai_response(message))
 
-            st.markdown("""
-                <div class="card">
-                    <h4>🏨 Hotels & Resorts</h4>
-                    <ul>
-                        <li>Accommodation options</li>
-                        <li>Price ranges per night</li>
-                        <li>Amenities and features</li>
-                        <li>Location advantages</li>
-                    </ul>
-                </div>
-            """, unsafe_allow_html=True)
 
+class UIComponents:
+    """Reusable UI components for the Travel Buddy app"""
+    
+    def display_app_header(self):
+        """Display the app header"""
+        st.title("🧳 Travel Buddy 🏍️")
+        st.markdown("*Your AI-powered travel companion for discovering amazing places, restaurants, activities, and accommodations worldwide.*")
+
+    def display_welcome_screen(self):
+        """Display a modern welcome screen using cards with a clean, elegant UI"""
+        st.markdown(_WELCOME_HTML, unsafe_allow_html=True)
         self.display_footer()
     
     def display_search_results(self, results, selected_query_type):
@@ -105,8 +158,20 @@ class UIComponents:
         
         # AI Recommendations
         st.subheader("🤖 AI Travel Recommendations")
-        formatted_response = format_ai_response(results['ai_response'])
-        st.markdown(formatted_response)
+        # Same response object as the previous rerun: reuse its blocks instead
+        # of formatting and splitting the text again; this is the only cache
+        ai_response = results['ai_response']
+        cached = st.session_state.get('_ai_blocks')
+        if cached is not None and cached[0] is ai_response:
+            blocks = cached[1]
+        else:
+            blocks = _split_markdown_blocks(format_ai_response(ai_response))
+            st.session_state['_ai_blocks'] = (ai_response, blocks)
+        
+        # One element per block keeps each frontend markdown parse small and
+        # lets unchanged blocks be skipped when the page reruns
+        for block in blocks:
+            st.markdown(block)
         
         # Raw data display
         st.markdown("### 📊 View Detailed Place Information")
@@ -144,23 +209,4 @@ class UIComponents:
     
     def create_chat_message_html(self, message, is_user=True):
         """Create HTML for chat message display"""
-        if is_user:
-            return f"""
-            <div style="display: flex; justify-content: flex-end; margin: 10px 0;">
-                <div style="background: aliceblue;
-                color: #000; padding: 12px 16px; border-radius: 18px 18px 5px 18px; 
-                            max-width: 70%; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
-                    <strong>You:</strong><br>{message}
-                </div>
-            </div>
-            """
-        else:
-            return f"""
-            <div style="display: flex; justify-content: flex-start; margin: 10px 0;">
-                <div style="background: darkturquoise;
-                            color: #000; padding: 12px 16px; border-radius: 18px 18px 18px 5px; 
-                            max-width: 70%; box-shadow: 0 2px 8px rgba(0,0,0,0.15);">
-                    <strong>🤖 Travel Buddy:</strong><br>{format_ai_response(message)}
-                </div>
-            </div>
-            """
\ No newline at end of file
+        return _chat_html(message, is_user)
@@ -2,21 +2,36 @@ import streamlit as st
 import logging
 from datetime import datetime
 from utils.helpers import get_distance_options
-from utils.pdf_export_helper import create_pdf_report
+
+# Sidebar choices are static; build the option lists once at import
+_QUERY_TYPES = (
+    ("🏛️ Tourist Places", "tourist_places"),
+    ("🍽️ Restaurants", "restaurants"),
+    ("🎯 Activities", "activities"),
+    ("🏨 Hotels & Resorts", "hotels")
+)
+_QUERY_LABELS = tuple(label for label, _ in _QUERY_TYPES)
+_QUERY_MAP = dict(_QUERY_TYPES)
+
+_DISTANCE_OPTIONS = get_distance_options()
+_DISTANCE_LABELS = tuple(_DISTANCE_OPTIONS)
+
+# Filename slug for the PDF export: spaces to underscores, drop commas and dots
+_SLUG_TABLE = str.maketrans({' ': '_', ',': None, '.': None})
 
 class SidebarManager:
     """Manages the sidebar UI and interactions"""
     
     def __init__(self):
-        self.query_types = {
-            "🏛️ Tourist Places": "tourist_places",
-            "🍽️ Restaurants": "restaurants", 
-            "🎯 Activities": "activities",
-            "🏨 Hotels & Resorts": "hotels"
-        }
+        self.query_types = _QUERY_MAP
     
     def render_sidebar(self):
         """Render the complete sidebar and return search parameters"""
+        # Confirmation left by an action that triggered a rerun
+        flash_message = st.session_state.pop('_flash', None)
+        if flash_message:
+            st.toast(flash_message)
+        
         with st.sidebar:
             # Search options section
             search_params = self._render_search_options()
@@ -38,12 +53,11 @@ class SidebarManager:
         location = st.text_input("📍 Enter Location", placeholder="e.g., Gokarna, Hampi, Mysore..")
         
         # Search radius
-        distance_options = get_distance_options()
-        selected_distance = st.selectbox("🔍 Search Radius", list(distance_options.keys()), index=2)
-        search_radius = distance_options[selected_distance]
+        selected_distance = st.selectbox("🔍 Search Radius", _DISTANCE_LABELS, index=2)
+        search_radius = _DISTANCE_OPTIONS[selected_distance]
         
         # Query type selection
-        selected_query_type = st.selectbox("🎭 What are you looking for?", list(self.query_types.keys()))
+        selected_query_type = st.selectbox("🎭 What are you looking for?", _QUERY_LABELS)
         query_type = self.query_types[selected_query_type]
         
         # Search button
@@ -67,13 +81,10 @@ class SidebarManager:
             conversation_history = st.session_state.get('conversation_history', [])
             
             # Create PDF with proper error handling
-            pdf_buffer = create_pdf_report(
-                st.session_state.search_results, 
-                conversation_history
-            )
+            pdf_buffer = self._get_pdf_bytes(st.session_state.search_results, conversation_history)
             
             # Generate filename
-            location_clean = st.session_state.search_results['location'].replace(' ', '_').replace(',', '').replace('.', '')
+            location_clean = st.session_state.search_results['location'].translate(_SLUG_TABLE)
             filename = f"travel_buddy_{location_clean}_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
             
             st.download_button(
@@ -96,27 +107,55 @@ class SidebarManager:
             st.error(f"❌ Error creating PDF: {str(e)}")
             st.info("💡 Try searching again or clearing chat history if the error persists.")
     
+    def _get_pdf_bytes(self, search_results, conversation_history):
+        """Get the PDF report bytes, rebuilding only when the results or conversation changed"""
+        # Search results are replaced on every new search and history is only
+        # appended to or replaced, so identity plus length pins the inputs
+        cached = st.session_state.get('_pdf_cache')
+        if (cached is not None and cached[0] is search_results
+                and cached[1] is conversation_history and cached[2] == len(conversation_history)):
+            return cached[3]
+        
+        # ReportLab is only needed once there is something to export, so keep
+        # it off the cold-start import path
+        from utils.pdf_export_helper import create_pdf_report
+        
+        pdf_bytes = create_pdf_report(search_results, conversation_history)
+        st.session_state['_pdf_cache'] = (search_results, conversation_history, len(conversation_history), pdf_bytes)
+        return pdf_bytes
+    
     def _render_conversation_section(self):
         """Render conversation management section"""
         st.header("💬 Conversation")
         
+        # Read session state through the proxy once per render
+        session_state = st.session_state
+        conversation_history = session_state.get('conversation_history', [])
+        
         if st.button("🗑️ Clear History"):
             # Keep initial search results but clear follow-up conversations
-            if len(st.session_state.conversation_history) > 2:
-                st.session_state.conversation_history = st.session_state.conversation_history[:2]
+            if len(conversation_history) > 2:
+                session_state.conversation_history = conversation_history[:2]
             else:
-                st.session_state.conversation_history = []
+                session_state.conversation_history = []
             
             # Clear context history (assuming context service is available)
             # This would need to be passed in or accessed differently
-            st.session_state.processing_question = False
-            st.success("Chat history cleared!")
+            session_state.processing_question = False
+            # Shown as a toast on the next run; anything rendered before st.rerun is discarded
+            session_state['_flash'] = "Chat history cleared!"
             st.rerun()
         
         # Display conversation count
-        history_count = len(st.session_state.get('conversation_history', []))
+        history_count = len(conversation_history)
         if history_count > 2:
             follow_up_count = history_count - 2
             st.info(f"Follow-up messages: {follow_up_count}")
         else:
-            st.info("No follow-up conversations yet")
\ No newline at end of file
+            st.info("No follow-up conversations yet")
+
+
+@st.cache_resource
+def get_sidebar_manager():
+    """Get the shared SidebarManager; it holds no per-session state"""
+    return SidebarManager()
@@ -1,4 +1,8 @@
 import streamlit as st
+from types import MappingProxyType
+
+# Price level -> dollar signs; built once at import
+_PRICE_LEVELS = {1: "$", 2: "$$", 3: "$$$", 4: "$$$$"}
 
 def display_places_data(places_data, title):
     """Display places data in a formatted way"""
@@ -12,20 +16,26 @@ def display_places_data(places_data, title):
         with st.expander(f"{i}. {place.get('name', 'Unknown Place')} ⭐ {place.get('rating', 'N/A')}"):
             col1, col2 = st.columns(2)
             
+            # Each column's lines go out as one markdown element instead of
+            # one st.write per field
+            left = [f"**Address:** {place.get('vicinity', place.get('formatted_address', 'N/A'))}"]
+            if 'types' in place:
+                left.append(f"**Category:** {', '.join(place['types'][:2])}")
+            if place.get('rating'):
+                left.append(f"**Rating:** {place['rating']} ⭐")
+            
+            right = []
+            if 'price_level' in place:
+                right.append(f"**Price Level:** {_PRICE_LEVELS.get(place['price_level'], 'N/A')}")
+            if place.get('user_ratings_total'):
+                right.append(f"**Reviews:** {place['user_ratings_total']} reviews")
+            
             with col1:
-                st.write(f"**Address:** {place.get('vicinity', place.get('formatted_address', 'N/A'))}")
-                if 'types' in place:
-                    st.write(f"**Category:** {', '.join(place['types'][:2])}")
-                if place.get('rating'):
-                    st.write(f"**Rating:** {place['rating']} ⭐")
+                st.markdown("\n\n".join(left))
             
             with col2:
-                if 'price_level' in place:
-                    price_levels = {1: "$", 2: "$$", 3: "$$$", 4: "$$$$"}
-                    st.write(f"**Price Level:** {price_levels.get(place['price_level'], 'N/A')}")
-                
-                if place.get('user_ratings_total'):
-                    st.write(f"**Reviews:** {place['user_ratings_total']} reviews")
+                if right:
+                    st.markdown("\n\n".join(right))
 
 def create_summary_card(location, total_places, total_restaurants, total_activities, total_hotels):
     """Create a summary card with key statistics"""
@@ -45,25 +55,20 @@ def create_summary_card(location, total_places, total_restaurants, total_activit
 
 def format_ai_response(response):
     """Format AI response for better display"""
-    # Split response into sections if it contains clear markers
+    # Split response into sections if it contains clear markers and drop the
+    # blank ones; a single join keeps this linear in the response length
     sections = response.split('\n\n')
-    formatted_response = ""
-    
-    for section in sections:
-        if section.strip():
-            # Check if section starts with a number (numbered list)
-            if section.strip()[0].isdigit():
-                formatted_response += f"\n\n{section}"
-            else:
-                formatted_response += f"\n\n{section}"
-    
-    return formatted_response.strip()
+    return '\n\n'.join(section for section in sections if section.strip()).strip()
+
+# Search radius choices, label -> meters; built once at import and read-only
+# since every caller shares the same mapping
+_DISTANCE_OPTIONS = MappingProxyType({
+    "10 km": 10000,
+    "25 km": 25000,
+    "50 km": 50000,
+    "100 km": 100000
+})
 
 def get_distance_options():
     """Get distance options for search radius"""
-    return {
-        "10 km": 10000,
-        "25 km": 25000,
-        "50 km": 50000,
-        "100 km": 100000
-    }
\ No newline at end of file
+    return _DISTANCE_OPTIONS
\ No newline at end of file
@@ -5,11 +5,62 @@ from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
 from reportlab.graphics.shapes import Drawing, Line
+import functools
 import io
 from datetime import datetime
 import re
 import logging
 
+# Unicode punctuation that the PDF fonts render poorly plus the XML escapes
+# ReportLab markup needs, applied together in a single translate pass
+_PDF_CHAR_TABLE = str.maketrans({
+    '\u2019': "'", '\u2018': "'", 
+    '\u201c': '"', '\u201d': '"',
+    '\u2013': '-', '\u2014': '--', 
+    '\u2026': '...', '\u00a0': ' ',
+    '\u2022': '•', '\u2023': '▶',
+    '&': '&amp;', '<': '&lt;', '>': '&gt;'
+})
+
+# Precompiled patterns for clean_text_for_pdf
+_MULTI_NEWLINE_PATTERN = re.compile(r'\n\s*\n\s*\n+')
+_MULTI_SPACE_PATTERN = re.compile(r' +')
+_PDF_MARKUP_CHARS_PATTERN = re.compile(r'[\n*&<>]')
+_BOLD_PATTERN = re.compile(r'\*\*([^*]+?)\*\*')
+_ITALIC_PATTERN = re.compile(r'(?<!\*)\*([^*\n]+?)\*(?!\*)')
+_EMPTY_BOLD_PATTERN = re.compile(r'<b>\s*</b>')
+_EMPTY_ITALIC_PATTERN = re.compile(r'<i>\s*</i>')
+_NESTED_BOLD_START_PATTERN = re.compile(r'<b>([^<]*)<b>')
+_NESTED_BOLD_END_PATTERN = re.compile(r'</b>([^>]*)</b>')
+_NESTED_ITALIC_START_PATTERN = re.compile(r'<i>([^<]*)<i>')
+_NESTED_ITALIC_END_PATTERN = re.compile(r'</i>([^>]*)</i>')
+
+# Precompiled patterns for parsing the cleaned AI response
+_SECTION_SPLIT_PATTERN = re.compile(r'(?=###\s|####\s|\d+\.\s+<b>)')
+_HEADER_MARKER_PATTERN = re.compile(r'#{2,4}\s*')
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_NUMBERED_ENTRY_PATTERN = re.compile(r'\d+\.\s+<b>')
+_PLACE_LINE_PATTERN = re.compile(r'(\d+)\.\s+<b>(.*?)</b>(?:\s*-\s*<b>Rating:</b>\s*([\d.]+))?')
+_PLACE_FIELD_PATTERN = re.compile(r'<b>(Address|Description|Categories):</b>\s*')
+
+# Whole-star rating -> stars shown next to a place title
+_RATING_STARS = ('', '⭐', '⭐⭐', '⭐⭐⭐', '⭐⭐⭐⭐', '⭐⭐⭐⭐⭐')
+
+# Labels for the detail fields of a numbered place entry
+_PLACE_FIELD_LABELS = {
+    'Address': "📍 <b>Location:</b>",
+    'Description': "📝 <b>About:</b>",
+    'Categories': "🏷️ <b>Type:</b>"
+}
+
+# Display labels for the search focus shown in the trip information box
+_QUERY_TYPE_LABELS = {
+    "tourist_places": "🏛️ Tourist Places & Attractions",
+    "restaurants": "🍽️ Restaurants & Dining",
+    "activities": "🎯 Activities & Adventures", 
+    "hotels": "🏨 Hotels & Accommodations"
+}
+
 def create_beautiful_header_line(width=6*inch, color='#2E86AB'):
     """Create a decorative header line"""
     drawing = Drawing(width, 10)
@@ -22,7 +73,138 @@ def create_section_divider(width=6*inch, color='#E8E8E8'):
     drawing.add(Line(width*0.25, 7, width*0.75, 7, strokeColor=colors.HexColor(color), strokeWidth=1))
     return drawing
 
-def create_pdf_report(search_results, conversation_history=None):
+_STYLES = getSampleStyleSheet()
+
+# Enhanced Custom Styles, built once at import and shared by every report
+_TITLE_STYLE = ParagraphStyle(
+    'BeautifulTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=28,
+    spaceAfter=20,
+    spaceBefore=20,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#1A365D'),
+    fontName='Helvetica-Bold'
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'BeautifulSubtitle',
+    parent=_STYLES['Heading2'],
+    fontSize=18,
+    spaceAfter=15,
+    spaceBefore=20,
+    textColor=colors.HexColor('#2D3748'),
+    fontName='Helvetica-Bold',
+    borderPadding=5
+)
+
+_PLACE_TITLE_STYLE = ParagraphStyle(
+    'PlaceTitle',
+    parent=_STYLES['Normal'],
+    fontSize=14,
+    spaceAfter=8,
+    spaceBefore=12,
+    textColor=colors.HexColor('#1A202C'),
+    fontName='Helvetica-Bold',
+    backColor=colors.HexColor('#F7FAFC'),
+    borderColor=colors.HexColor('#E2E8F0'),
+    borderWidth=1,
+    borderPadding=8,
+    borderRadius=3
+)
+
+_PLACE_DETAIL_STYLE = ParagraphStyle(
+    'PlaceDetail',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=6,
+    leftIndent=15,
+    rightIndent=15,
+    alignment=TA_JUSTIFY,
+    textColor=colors.HexColor('#2D3748'),
+    leading=14
+)
+
+_INFO_BOX_STYLE = ParagraphStyle(
+    'InfoBox',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    spaceAfter=8,
+    leftIndent=20,
+    rightIndent=20,
+    backColor=colors.HexColor('#EBF8FF'),
+    borderColor=colors.HexColor('#3182CE'),
+    borderWidth=1,
+    borderPadding=10,
+    borderRadius=5,
+    textColor=colors.HexColor('#2A4365')
+)
+
+# Enhanced Chat Styles
+_CHAT_USER_STYLE = ParagraphStyle(
+    'ChatUserBeautiful',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=10,
+    spaceBefore=8,
+    leftIndent=30,
+    rightIndent=80,
+    backColor=colors.HexColor('#F0FFF4'),
+    borderColor=colors.HexColor('#38A169'),
+    borderWidth=1,
+    borderPadding=12,
+    borderRadius=8,
+    textColor=colors.HexColor('#1A202C')
+)
+
+_CHAT_AI_STYLE = ParagraphStyle(
+    'ChatAIBeautiful',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=10,
+    spaceBefore=8,
+    leftIndent=80,
+    rightIndent=30,
+    backColor=colors.HexColor('#FFF5F5'),
+    borderColor=colors.HexColor('#E53E3E'),
+    borderWidth=1,
+    borderPadding=12,
+    borderRadius=8,
+    textColor=colors.HexColor('#1A202C')
+)
+
+_META_STYLE = ParagraphStyle(
+    'MetaStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    spaceAfter=5,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#718096'),
+    fontName='Helvetica-Oblique'
+)
+
+_NO_CHAT_STYLE = ParagraphStyle(
+    'NoChat',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#718096'),
+    backColor=colors.HexColor('#F7FAFC'),
+    borderPadding=15,
+    borderColor=colors.HexColor('#E2E8F0'),
+    borderWidth=1
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'BeautifulFooter',
+    parent=_STYLES['Normal'],
+    fontSize=10,
+    alignment=TA_CENTER,
+    textColor=colors.HexColor('#718096'),
+    leading=14
+)
+
+def create_pdf_report(search_results, conversation_history=None) -> bytes:
     """Create a beautifully formatted PDF report with travel recommendations and chat history"""
     if conversation_history is None:
         conversation_history = []
@@ -38,127 +220,19 @@ def create_pdf_report(search_results, conversation_history=None):
     )
     
     elements = []
-    styles = getSampleStyleSheet()
-    
-    # Enhanced Custom Styles
-    title_style = ParagraphStyle(
-        'BeautifulTitle',
-        parent=styles['Heading1'],
-        fontSize=28,
-        spaceAfter=20,
-        spaceBefore=20,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#1A365D'),
-        fontName='Helvetica-Bold'
-    )
-    
-    subtitle_style = ParagraphStyle(
-        'BeautifulSubtitle',
-        parent=styles['Heading2'],
-        fontSize=18,
-        spaceAfter=15,
-        spaceBefore=20,
-        textColor=colors.HexColor('#2D3748'),
-        fontName='Helvetica-Bold',
-        borderPadding=5
-    )
-    
-    place_title_style = ParagraphStyle(
-        'PlaceTitle',
-        parent=styles['Normal'],
-        fontSize=14,
-        spaceAfter=8,
-        spaceBefore=12,
-        textColor=colors.HexColor('#1A202C'),
-        fontName='Helvetica-Bold',
-        backColor=colors.HexColor('#F7FAFC'),
-        borderColor=colors.HexColor('#E2E8F0'),
-        borderWidth=1,
-        borderPadding=8,
-        borderRadius=3
-    )
-    
-    place_detail_style = ParagraphStyle(
-        'PlaceDetail',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6,
-        leftIndent=15,
-        rightIndent=15,
-        alignment=TA_JUSTIFY,
-        textColor=colors.HexColor('#2D3748'),
-        leading=14
-    )
-    
-    info_box_style = ParagraphStyle(
-        'InfoBox',
-        parent=styles['Normal'],
-        fontSize=10,
-        spaceAfter=8,
-        leftIndent=20,
-        rightIndent=20,
-        backColor=colors.HexColor('#EBF8FF'),
-        borderColor=colors.HexColor('#3182CE'),
-        borderWidth=1,
-        borderPadding=10,
-        borderRadius=5,
-        textColor=colors.HexColor('#2A4365')
-    )
-    
-    # Enhanced Chat Styles
-    chat_user_style = ParagraphStyle(
-        'ChatUserBeautiful',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=10,
-        spaceBefore=8,
-        leftIndent=30,
-        rightIndent=80,
-        backColor=colors.HexColor('#F0FFF4'),
-        borderColor=colors.HexColor('#38A169'),
-        borderWidth=1,
-        borderPadding=12,
-        borderRadius=8,
-        textColor=colors.HexColor('#1A202C')
-    )
-    
-    chat_ai_style = ParagraphStyle(
-        'ChatAIBeautiful',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=10,
-        spaceBefore=8,
-        leftIndent=80,
-        rightIndent=30,
-        backColor=colors.HexColor('#FFF5F5'),
-        borderColor=colors.HexColor('#E53E3E'),
-        borderWidth=1,
-        borderPadding=12,
-        borderRadius=8,
-        textColor=colors.HexColor('#1A202C')
-    )
-    
-    meta_style = ParagraphStyle(
-        'MetaStyle',
-        parent=styles['Normal'],
-        fontSize=9,
-        spaceAfter=5,
-        alignment=TA_CENTER,
-        textColor=colors.HexColor('#718096'),
-        fontName='Helvetica-Oblique'
-    )
     
     # Beautiful Header Section
     elements.append(create_beautiful_header_line())
     elements.append(Spacer(1, 10))
     
     # Main Title with Icon
-    title = Paragraph("🌟 Travel Buddy Recommendations", title_style)
+    title = Paragraph("🌟 Travel Buddy Recommendations", _TITLE_STYLE)
     elements.append(title)
     
-    # Subtitle with date
-    date_str = datetime.now().strftime("%B %d, %Y")
-    subtitle = Paragraph(f"Your Personalized Travel Guide • {date_str}", meta_style)
+    # Subtitle with date; one timestamp serves the subtitle and the info box
+    generated_at = datetime.now()
+    date_str = generated_at.strftime("%B %d, %Y")
+    subtitle = Paragraph(f"Your Personalized Travel Guide • {date_str}", _META_STYLE)
     elements.append(subtitle)
     
     elements.append(Spacer(1, 15))
@@ -166,42 +240,33 @@ def create_pdf_report(search_results, conversation_history=None):
     elements.append(Spacer(1, 25))
     
     # Trip Information Box
-    query_type_map = {
-        "tourist_places": "🏛️ Tourist Places & Attractions",
-        "restaurants": "🍽️ Restaurants & Dining",
-        "activities": "🎯 Activities & Adventures", 
-        "hotels": "🏨 Hotels & Accommodations"
-    }
-    query_display = query_type_map.get(search_results['query_type'], search_results['query_type'])
+    query_display = _QUERY_TYPE_LABELS.get(search_results['query_type'], search_results['query_type'])
     
     trip_info = f"""
     📍 <b>Destination:</b> {search_results['location']}<br/>
     🔍 <b>Search Focus:</b> {query_display}<br/>
-    📅 <b>Report Generated:</b> {datetime.now().strftime("%I:%M %p, %B %d, %Y")}
+    📅 <b>Report Generated:</b> {generated_at.strftime("%I:%M %p, %B %d, %Y")}
     """
     
-    info_box = Paragraph(trip_info, info_box_style)
+    info_box = Paragraph(trip_info, _INFO_BOX_STYLE)
     elements.append(info_box)
     elements.append(Spacer(1, 25))
     
     # AI Recommendations Section
-    rec_section = Paragraph("🤖 Your AI Travel Recommendations", subtitle_style)
+    rec_section = Paragraph("🤖 Your AI Travel Recommendations", _SUBTITLE_STYLE)
     elements.append(rec_section)
     elements.append(create_section_divider())
     elements.append(Spacer(1, 15))
     
     # Parse and beautifully format AI response
     ai_response = search_results.get('ai_response', '')
-    formatted_recommendations = format_ai_recommendations(ai_response, place_title_style, place_detail_style, info_box_style)
-    
-    for element in formatted_recommendations:
-        elements.append(element)
+    elements.extend(format_ai_recommendations(ai_response, _PLACE_TITLE_STYLE, _PLACE_DETAIL_STYLE, _INFO_BOX_STYLE))
     
     elements.append(Spacer(1, 25))
     
     # Detailed Places Table (Enhanced)
     if search_results.get('places_data'):
-        places_section = Paragraph("📊 Quick Reference Guide", subtitle_style)
+        places_section = Paragraph("📊 Quick Reference Guide", _SUBTITLE_STYLE)
         elements.append(places_section)
         elements.append(create_section_divider())
         elements.append(Spacer(1, 15))
@@ -214,7 +279,7 @@ def create_pdf_report(search_results, conversation_history=None):
     if conversation_history and len(conversation_history) > 2:
         elements.append(PageBreak())
         
-        chat_header = Paragraph("💬 Your Travel Conversation", subtitle_style)
+        chat_header = Paragraph("💬 Your Travel Conversation", _SUBTITLE_STYLE)
         elements.append(chat_header)
         elements.append(create_section_divider())
         elements.append(Spacer(1, 15))
@@ -222,23 +287,18 @@ def create_pdf_report(search_results, conversation_history=None):
         # Conversation summary
         follow_up_messages = conversation_history[2:] if len(conversation_history) > 2 else []
         summary_text = f"💡 This conversation contains {len(follow_up_messages)} personalized questions and detailed AI responses to help you plan your perfect trip."
-        summary = Paragraph(summary_text, info_box_style)
+        summary = Paragraph(summary_text, _INFO_BOX_STYLE)
         elements.append(summary)
         elements.append(Spacer(1, 20))
         
         # Format conversation beautifully
-        chat_elements = format_conversation_history(follow_up_messages, chat_user_style, chat_ai_style, meta_style)
-        for element in chat_elements:
-            elements.append(element)
+        elements.extend(format_conversation_history(follow_up_messages, _CHAT_USER_STYLE, _CHAT_AI_STYLE, _META_STYLE))
     
     elif conversation_history and len(conversation_history) <= 2:
         elements.append(Spacer(1, 20))
         no_chat_note = Paragraph(
             "💡 <i>Start a conversation with Travel Buddy! Ask follow-up questions about your destination, and they'll appear in your next PDF report with personalized answers.</i>", 
-            ParagraphStyle('NoChat', parent=styles['Normal'], fontSize=11, 
-                         alignment=TA_CENTER, textColor=colors.HexColor('#718096'),
-                         backColor=colors.HexColor('#F7FAFC'), borderPadding=15,
-                         borderColor=colors.HexColor('#E2E8F0'), borderWidth=1)
+            _NO_CHAT_STYLE
         )
         elements.append(no_chat_note)
     
@@ -253,11 +313,7 @@ def create_pdf_report(search_results, conversation_history=None):
     <i>Crafted with ❤️ by Traveller Vishwa</i>
     """
     
-    footer = Paragraph(footer_content, 
-                      ParagraphStyle('BeautifulFooter', parent=styles['Normal'], 
-                                   fontSize=10, alignment=TA_CENTER, 
-                                   textColor=colors.HexColor('#718096'),
-                                   leading=14))
+    footer = Paragraph(footer_content, _FOOTER_STYLE)
     elements.append(footer)
     
     # Build PDF with error handling
@@ -267,22 +323,22 @@ def create_pdf_report(search_results, conversation_history=None):
         logging.error(f"Error building PDF: {str(e)}")
         # Create fallback minimal PDF
         fallback_elements = [
-            Paragraph("🌟 Travel Buddy Report", title_style),
+            Paragraph("🌟 Travel Buddy Report", _TITLE_STYLE),
             Spacer(1, 20),
-            Paragraph(f"📍 Destination: {search_results.get('location', 'Unknown')}", place_detail_style),
+            Paragraph(f"📍 Destination: {search_results.get('location', 'Unknown')}", _PLACE_DETAIL_STYLE),
             Spacer(1, 15),
-            Paragraph("⚠️ An error occurred while generating the full report. Please try again.", place_detail_style),
+            Paragraph("⚠️ An error occurred while generating the full report. Please try again.", _PLACE_DETAIL_STYLE),
             Spacer(1, 15),
-            Paragraph("If the problem persists, please contact our support team.", place_detail_style)
+            Paragraph("If the problem persists, please contact our support team.", _PLACE_DETAIL_STYLE)
         ]
         doc.build(fallback_elements)
     
-    buffer.seek(0)
-    return buffer
+    return buffer.getvalue()
 
 def format_ai_recommendations(ai_response, title_style, detail_style, info_style):
     """Parse and beautifully format AI recommendations"""
     elements = []
+    append = elements.append  # bound once, called for every flowable below
     
     if not ai_response:
         return elements
@@ -291,7 +347,7 @@ def format_ai_recommendations(ai_response, title_style, detail_style, info_style
     cleaned_text = clean_text_for_pdf(ai_response)
     
     # Split into sections - be more careful with regex
-    sections = re.split(r'(?=###\s|####\s|\d+\.\s+<b>)', cleaned_text)
+    sections = _SECTION_SPLIT_PATTERN.split(cleaned_text)
     
     for section in sections:
         if not section.strip():
@@ -303,23 +359,23 @@ def format_ai_recommendations(ai_response, title_style, detail_style, info_style
                 # Main section header
                 lines = section.split('<br/>')
                 header_line = lines[0] if lines else section
-                header_text = re.sub(r'#{2,4}\s*', '', header_line)
+                header_text = _HEADER_MARKER_PATTERN.sub('', header_line)
                 
                 if header_text.strip():
                     # Remove any remaining HTML tags from header
-                    clean_header = re.sub(r'<[^>]+>', '', header_text.strip())
-                    elements.append(Paragraph(f"🎯 {clean_header}", title_style))
-                    elements.append(Spacer(1, 10))
+                    clean_header = _HTML_TAG_PATTERN.sub('', header_text.strip())
+                    append(Paragraph(f"🎯 {clean_header}", title_style))
+                    append(Spacer(1, 10))
                     
                     # Add remaining content if any
                     remaining_lines = lines[1:] if len(lines) > 1 else []
                     if remaining_lines:
                         remaining_content = '<br/>'.join(remaining_lines).strip()
                         if remaining_content:
-                            elements.append(Paragraph(remaining_content, detail_style))
-                            elements.append(Spacer(1, 15))
+                            append(Paragraph(remaining_content, detail_style))
+                            append(Spacer(1, 15))
             
-            elif re.match(r'\d+\.\s+<b>', section.strip()):
+            elif _NUMBERED_ENTRY_PATTERN.match(section.strip()):
                 # Numbered place entry
                 place_elements = format_place_entry_safe(section, title_style, detail_style, info_style)
                 elements.extend(place_elements)
@@ -327,22 +383,23 @@ def format_ai_recommendations(ai_response, title_style, detail_style, info_style
             else:
                 # Regular paragraph
                 if section.strip():
-                    elements.append(Paragraph(section.strip(), detail_style))
-                    elements.append(Spacer(1, 10))
+                    append(Paragraph(section.strip(), detail_style))
+                    append(Spacer(1, 10))
                     
         except Exception as e:
             # If formatting fails, add as plain text
             logging.warning(f"Failed to format section, using plain text: {str(e)}")
-            plain_text = re.sub(r'<[^>]+>', '', section.strip())
+            plain_text = _HTML_TAG_PATTERN.sub('', section.strip())
             if plain_text:
-                elements.append(Paragraph(plain_text, detail_style))
-                elements.append(Spacer(1, 10))
+                append(Paragraph(plain_text, detail_style))
+                append(Spacer(1, 10))
     
     return elements
 
 def format_place_entry_safe(entry_text, title_style, detail_style, info_style):
     """Safely format individual place entries with error handling"""
     elements = []
+    append = elements.append  # bound once, called for every flowable below
     
     try:
         lines = entry_text.strip().split('<br/>')
@@ -351,18 +408,18 @@ def format_place_entry_safe(entry_text, title_style, detail_style, info_style):
         
         # Extract place name and rating from first line
         first_line = lines[0].strip()
-        place_match = re.match(r'(\d+)\.\s+<b>(.*?)</b>(?:\s*-\s*<b>Rating:</b>\s*([\d.]+))?', first_line)
+        place_match = _PLACE_LINE_PATTERN.match(first_line)
         
         if place_match:
             number, place_name, rating = place_match.groups()
             
             # Create beautiful place header
-            rating_stars = "⭐" * min(5, int(float(rating or 0))) if rating else ""
+            rating_stars = _RATING_STARS[max(0, min(5, int(float(rating))))] if rating else ""
             place_header = f"{number}. {place_name} {rating_stars}"
             if rating:
                 place_header += f" ({rating}/5)"
             
-            elements.append(Paragraph(place_header, title_style))
+            append(Paragraph(place_header, title_style))
             
             # Process remaining details safely
             details = []
@@ -372,115 +429,111 @@ def format_place_entry_safe(entry_text, title_style, detail_style, info_style):
                 if not line:
                     continue
                 
-                # Extract different types of information
-                if '<b>Address:</b>' in line:
-                    address = re.sub(r'.*?<b>Address:</b>\s*', '', line)
-                    address = re.sub(r'<[^>]+>', '', address)  # Remove any remaining tags
-                    details.append(f"📍 <b>Location:</b> {address}")
-                elif '<b>Description:</b>' in line:
-                    desc = re.sub(r'.*?<b>Description:</b>\s*', '', line)
-                    desc = re.sub(r'<[^>]+>', '', desc)  # Remove any remaining tags
-                    details.append(f"📝 <b>About:</b> {desc}")
-                elif '<b>Categories:</b>' in line:
-                    categories = re.sub(r'.*?<b>Categories:</b>\s*', '', line)
-                    categories = re.sub(r'<[^>]+>', '', categories)  # Remove any remaining tags
-                    details.append(f"🏷️ <b>Type:</b> {categories}")
+                # Extract different types of information with one scan per line
+                field = _PLACE_FIELD_PATTERN.search(line)
+                if field:
+                    label = _PLACE_FIELD_LABELS[field.group(1)]
+                    value = _HTML_TAG_PATTERN.sub('', line[field.end():])  # Remove any remaining tags
+                    details.append(f"{label} {value}")
                 else:
                     # Handle any other content
-                    clean_line = re.sub(r'<[^>]+>', '', line)
+                    clean_line = _HTML_TAG_PATTERN.sub('', line)
                     if clean_line.strip():
                         details.append(clean_line.strip())
             
             # Add formatted details
             for detail in details:
                 if detail.strip():
-                    elements.append(Paragraph(detail.strip(), detail_style))
+                    append(Paragraph(detail.strip(), detail_style))
             
-            elements.append(Spacer(1, 15))
+            append(Spacer(1, 15))
             
     except Exception as e:
         # Fallback to plain text if anything goes wrong
         logging.warning(f"Failed to format place entry, using plain text: {str(e)}")
-        plain_text = re.sub(r'<[^>]+>', '', entry_text.strip())
+        plain_text = _HTML_TAG_PATTERN.sub('', entry_text.strip())
         if plain_text:
-            elements.append(Paragraph(plain_text, detail_style))
-            elements.append(Spacer(1, 15))
+            append(Paragraph(plain_text, detail_style))
+            append(Spacer(1, 15))
     
     return elements
 
+# Price level -> glyphs for the places table; 0 or missing shows N/A
+_PRICE_GLYPHS = ('N/A', '💰', '💰💰', '💰💰💰', '💰💰💰💰')
+
+# Beautiful table styling, shared by every places table
+_PLACES_TABLE_STYLE = TableStyle([
+    # Header styling
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2B6CB0')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
+    ('TOPPADDING', (0, 0), (-1, 0), 15),
+    
+    # Data rows styling
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F9FA')),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E2E8F0')),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFFFFF'), colors.HexColor('#F8F9FA')]),
+    ('LEFTPADDING', (0, 0), (-1, -1), 12),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 12),
+    ('TOPPADDING', (0, 1), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
+])
+
+def _places_table_row(place):
+    """Build one places table row with long names and addresses shortened"""
+    name = place.get('name', 'N/A')
+    if len(name) > 35:
+        name = name[:32] + "..."
+    
+    rating = place.get('rating', 'N/A')
+    rating_display = f"{rating}/5" if rating != 'N/A' else 'N/A'
+    
+    price_display = _PRICE_GLYPHS[min(place.get('price_level') or 0, 4)]
+    
+    address = place.get('vicinity', place.get('formatted_address', 'N/A'))
+    if len(address) > 45:
+        address = address[:42] + "..."
+    
+    return [name, rating_display, price_display, address]
+
 def create_beautiful_places_table(places_data):
     """Create a beautifully formatted places table"""
-    # Header with icons
+    # Header with icons, then the top 12 places
     table_data = [['🏛️ Place Name', '⭐ Rating', '💰 Price', '📍 Location']]
-    
-    for place in places_data[:12]:  # Show top 12 places
-        name = place.get('name', 'N/A')
-        if len(name) > 35:
-            name = name[:32] + "..."
-        
-        rating = place.get('rating', 'N/A')
-        rating_display = f"{rating}/5" if rating != 'N/A' else 'N/A'
-        
-        price_level = place.get('price_level', 0)
-        price_display = '💰' * price_level if price_level else 'N/A'
-        
-        address = place.get('vicinity', place.get('formatted_address', 'N/A'))
-        if len(address) > 45:
-            address = address[:42] + "..."
-        
-        table_data.append([name, rating_display, price_display, address])
+    table_data.extend(_places_table_row(place) for place in places_data[:12])
     
     table = Table(table_data, colWidths=[2.5*inch, 1*inch, 0.8*inch, 2.2*inch])
-    
-    # Beautiful table styling
-    table.setStyle(TableStyle([
-        # Header styling
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2B6CB0')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 15),
-        ('TOPPADDING', (0, 0), (-1, 0), 15),
-        
-        # Data rows styling
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#F8F9FA')),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#E2E8F0')),
-        ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.HexColor('#FFFFFF'), colors.HexColor('#F8F9FA')]),
-        ('LEFTPADDING', (0, 0), (-1, -1), 12),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 12),
-        ('TOPPADDING', (0, 1), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 10),
-    ]))
+    table.setStyle(_PLACES_TABLE_STYLE)
     
     return table
 
 def format_conversation_history(messages, user_style, ai_style, meta_style):
     """Format conversation history with beautiful styling"""
     elements = []
+    append = elements.append  # bound once, called for every flowable below
     
-    # Remove duplicates and get unique messages
-    seen_messages = set()
-    unique_messages = []
+    # Dedup on a case-insensitive prefix of the raw text; only the messages
+    # that make it into the report are cleaned below. The dict keeps the first
+    # occurrence of each key, in insertion order
+    unique_by_key = {}
     
     for msg in messages:
         content = msg.get('content', '').strip()
-        if content and len(content) > 10:  # Avoid very short messages
-            msg_hash = hash(content.lower()[:100])
-            if msg_hash not in seen_messages:
-                seen_messages.add(msg_hash)
-                unique_messages.append(msg)
+        if len(content) > 10:  # Avoid empty and very short messages
+            unique_by_key.setdefault(content[:100].casefold(), (msg.get('role', 'unknown'), content))
+    
+    unique_messages = list(unique_by_key.values())
     
     # Show last 20 messages for better context
     recent_messages = unique_messages[-20:] if len(unique_messages) > 20 else unique_messages
     
-    for i, msg in enumerate(recent_messages, 1):
-        role = msg.get('role', 'unknown')
-        content = msg.get('content', '')
-        
+    for i, (role, content) in enumerate(recent_messages, 1):
         if role == 'user':
             # Clean and limit user message length
             clean_content = clean_text_for_pdf(content)
@@ -489,11 +542,11 @@ def format_conversation_history(messages, user_style, ai_style, meta_style):
             
             user_text = f"<b>👤 You asked:</b><br/><br/>{clean_content}"
             try:
-                elements.append(Paragraph(user_text, user_style))
+                append(Paragraph(user_text, user_style))
             except Exception:
                 # Fallback to plain text if formatting fails
                 plain_text = f"You asked: {content[:500]}..."
-                elements.append(Paragraph(plain_text, user_style))
+                append(Paragraph(plain_text, user_style))
             
         elif role == 'assistant':
             # Clean and limit AI response length  
@@ -503,65 +556,58 @@ def format_conversation_history(messages, user_style, ai_style, meta_style):
             
             ai_text = f"<b>🤖 Travel Buddy replied:</b><br/><br/>{clean_content}"
             try:
-                elements.append(Paragraph(ai_text, ai_style))
+                append(Paragraph(ai_text, ai_style))
             except Exception:
                 # Fallback to plain text if formatting fails
                 plain_text = f"Travel Buddy replied: {content[:500]}..."
-                elements.append(Paragraph(plain_text, ai_style))
+                append(Paragraph(plain_text, ai_style))
         
         # Add conversation flow indicator
-        elements.append(Spacer(1, 8))
+        append(Spacer(1, 8))
         
         # Add section break every 6 messages
         if i % 6 == 0 and i < len(recent_messages):
-            elements.append(create_section_divider())
-            elements.append(Spacer(1, 10))
+            append(create_section_divider())
+            append(Spacer(1, 10))
     
     return elements
 
+@functools.lru_cache(maxsize=512)
 def clean_text_for_pdf(text):
     """Enhanced text cleaning for beautiful PDF formatting"""
     if not text:
         return ""
     
-    # Replace problematic Unicode characters
-    replacements = {
-        '\u2019': "'", '\u2018': "'", 
-        '\u201c': '"', '\u201d': '"',
-        '\u2013': '-', '\u2014': '--', 
-        '\u2026': '...', '\u00a0': ' ',
-        '\u2022': '•', '\u2023': '▶'
-    }
+    # Plain single-line ASCII has nothing to translate, escape or convert,
+    # which is the common case for short chat questions
+    if text.isascii() and not _PDF_MARKUP_CHARS_PATTERN.search(text):
+        return _MULTI_SPACE_PATTERN.sub(' ', text).strip()
     
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+    # Replace problematic Unicode characters and escape XML characters
+    # BEFORE processing markdown
+    text = text.translate(_PDF_CHAR_TABLE)
     
     # Clean up whitespace and formatting
-    text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)  # Multiple newlines
-    text = re.sub(r' +', ' ', text)  # Multiple spaces
-    
-    # First escape XML characters BEFORE processing markdown
-    text = text.replace('&', '&amp;')
-    text = text.replace('<', '&lt;')
-    text = text.replace('>', '&gt;')
+    text = _MULTI_NEWLINE_PATTERN.sub('\n\n', text)  # Multiple newlines
+    text = _MULTI_SPACE_PATTERN.sub(' ', text)  # Multiple spaces
     
     # Now safely convert markdown to HTML
     # Handle bold markdown **text** -> <b>text</b>
-    text = re.sub(r'\*\*([^*]+?)\*\*', r'<b>\1</b>', text)
+    text = _BOLD_PATTERN.sub(r'<b>\1</b>', text)
     # Handle italic markdown *text* -> <i>text</i> (but avoid conflicting with **)
-    text = re.sub(r'(?<!\*)\*([^*\n]+?)\*(?!\*)', r'<i>\1</i>', text)
+    text = _ITALIC_PATTERN.sub(r'<i>\1</i>', text)
     
     # Handle line breaks
     text = text.replace('\n', '<br/>')
     
     # Remove any remaining problematic characters or sequences
-    text = re.sub(r'<b>\s*</b>', '', text)  # Empty bold tags
-    text = re.sub(r'<i>\s*</i>', '', text)  # Empty italic tags
+    text = _EMPTY_BOLD_PATTERN.sub('', text)  # Empty bold tags
+    text = _EMPTY_ITALIC_PATTERN.sub('', text)  # Empty italic tags
     
     # Fix any nested or malformed tags
-    text = re.sub(r'<b>([^<]*)<b>', r'<b>\1', text)  # Nested bold start
-    text = re.sub(r'</b>([^>]*)</b>', r'\1</b>', text)  # Nested bold end
-    text = re.sub(r'<i>([^<]*)<i>', r'<i>\1', text)  # Nested italic start
-    text = re.sub(r'</i>([^>]*)</i>', r'\1</i>', text)  # Nested italic end
+    text = _NESTED_BOLD_START_PATTERN.sub(r'<b>\1', text)  # Nested bold start
+    text = _NESTED_BOLD_END_PATTERN.sub(r'\1</b>', text)  # Nested bold end
+    text = _NESTED_ITALIC_START_PATTERN.sub(r'<i>\1', text)  # Nested italic start
+    text = _NESTED_ITALIC_END_PATTERN.sub(r'\1</i>', text)  # Nested italic end
     
-    return text.strip()
+    return text.strip()
\ No newline at end of file
@@ -1,5 +1,6 @@
 import streamlit as st
 import time
+from config import Config
 
 class SessionManager:
     """Manages Streamlit session state variables"""
@@ -14,26 +15,29 @@ class SessionManager:
     
     def initialize_session_state(self):
         """Initialize all required session state variables"""
-        if 'conversation_history' not in st.session_state:
-            st.session_state.conversation_history = []
-
-        if 'last_search' not in st.session_state:
-            st.session_state.last_search = None
-
-        if 'search_results' not in st.session_state:
-            st.session_state.search_results = None
-        
-        if 'processing_question' not in st.session_state:
-            st.session_state.processing_question = False
+        # Read session state through the proxy once and set only what is missing
+        session_state = st.session_state
+        defaults = {
+            'conversation_history': [],
+            'last_search': None,
+            'search_results': None,
+            'processing_question': False
+        }
+        missing = {key: value for key, value in defaults.items() if key not in session_state}
+        if missing:
+            session_state.update(missing)
     
     def should_perform_new_search(self, search_params):
         """Check if a new search should be performed"""
-        current_search = (search_params['location'], search_params['query_type'])
+        current_search = (search_params['location'], search_params['query_type'], search_params['search_radius'])
         return st.session_state.get('last_search') != current_search
     
+    def record_search(self, location, query_type, search_radius):
+        """Remember the last attempted search so reruns don't repeat it"""
+        st.session_state.last_search = (location, query_type, search_radius)
+    
     def update_search_results(self, location, query_type, places_data, ai_response):
         """Update search results in session state"""
-        st.session_state.last_search = (location, query_type)
         st.session_state.search_results = {
             'places_data': places_data,
             'ai_response': ai_response,
@@ -41,20 +45,39 @@ class SessionManager:
             'query_type': query_type
         }
     
+    def clear_search_results(self):
+        """Drop the previous search's results and conversation after a search that produced none"""
+        session_state = st.session_state
+        session_state.search_results = None
+        session_state.conversation_history = []
+        session_state.nearby_places = None
+        session_state.processing_question = False
+    
     def clear_conversation_history(self, keep_initial_search=True):
         """Clear conversation history, optionally keeping initial search"""
-        if keep_initial_search and len(st.session_state.conversation_history) > 2:
-            st.session_state.conversation_history = st.session_state.conversation_history[:2]
+        session_state = st.session_state
+        conversation_history = session_state.conversation_history
+        if keep_initial_search and len(conversation_history) > 2:
+            session_state.conversation_history = conversation_history[:2]
         else:
-            st.session_state.conversation_history = []
-        st.session_state.processing_question = False
+            session_state.conversation_history = []
+        session_state.processing_question = False
     
     def add_conversation_messages(self, messages):
         """Add messages to conversation history"""
-        if 'conversation_history' not in st.session_state:
-            st.session_state.conversation_history = []
+        session_state = st.session_state
+        if 'conversation_history' not in session_state:
+            session_state.conversation_history = []
+        
+        history = session_state.conversation_history
+        history.extend(messages)
         
-        st.session_state.conversation_history.extend(messages)
+        # Keep the initial search pair and the most recent follow-ups so long
+        # sessions stay bounded; trimming builds a new list, which the
+        # identity-keyed render and export memos treat as a replacement
+        overflow = len(history) - Config.MAX_CONVERSATION_HISTORY
+        if overflow > 0:
+            session_state.conversation_history = history[:2] + history[2 + overflow:]
     
     def initialize_conversation_with_search(self, user_query, ai_response):
         """Initialize conversation history with search results"""